@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from collections.abc import Generator
 
-from .db import get_session
+from .db import get_read_session, get_session
 from .storage_db import DatabaseStore
 
 
 def get_store() -> Generator[DatabaseStore, None, None]:
     with get_session() as session:
         yield DatabaseStore(session)
+
+
+def get_read_store() -> Generator[DatabaseStore, None, None]:
+    with get_read_session() as session:
+        yield DatabaseStore(session)
@@ -7,13 +7,13 @@ import time
 import uuid
 from pathlib import Path
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, Response, UploadFile, status
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Query, Request, Response, UploadFile, status
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, StreamingResponse
 
 from . import auth, schemas
-from .db import get_session
-from .dependencies import get_store
+from .db import get_read_session, get_session
+from .dependencies import get_read_store, get_store
 from .observability import configure_logging, configure_tracing, get_logger
 from .services.alerts import AlertService, IntegrationMonitor
 from .services.budgets import BudgetLimitExceeded, BudgetService
@@ -42,6 +42,27 @@ def store_context() -> DatabaseStore:
         yield DatabaseStore(session)
 
 
+@contextmanager
+def read_store_context() -> DatabaseStore:
+    with get_read_session() as session:
+        yield DatabaseStore(session)
+
+
+def ndjson_response(iter_rows) -> StreamingResponse:
+    """Stream ``iter_rows(store)`` as NDJSON from a session owned by the body.
+
+    The request-scoped store may be closed before the body is sent, so the
+    generator opens its own session and keeps it for the whole stream.
+    """
+
+    def body():
+        with read_store_context() as store:
+            for row in iter_rows(store):
+                yield row.model_dump_json() + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
 def get_video_workshop_service(store: DatabaseStore) -> VideoWorkshopService:
     sora_base_url = os.getenv("SORA_BASE_URL", "http://localhost:9001")
     sora_api_key = os.getenv("SORA_API_KEY", "demo-key")
@@ -223,7 +244,7 @@ def create_redirect_link(
 )
 def list_redirect_links(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.RedirectLink]:
     try:
@@ -232,6 +253,25 @@ def list_redirect_links(
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@app.get(
+    "/projects/{project_id}/redirect-links/stats",
+    response_model=list[schemas.RedirectLinkStats],
+)
+def list_redirect_link_stats(
+    project_id: int,
+    store: DatabaseStore = Depends(get_read_store),
+    _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
+) -> list[schemas.RedirectLinkStats]:
+    try:
+        rows = store.list_redirect_links_with_counts(project_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return [
+        schemas.RedirectLinkStats(**link.model_dump(), click_count=click_count)
+        for link, click_count in rows
+    ]
+
+
 @app.get(
     "/projects/{project_id}/redirect-links/{link_id}/clicks",
     response_model=list[schemas.ClickEvent],
@@ -239,15 +279,42 @@ def list_redirect_links(
 def list_click_events(
     project_id: int,
     link_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.ClickEvent]:
     try:
-        return store.list_click_events(project_id, redirect_link_id=link_id)
+        return store.list_click_events(
+            project_id, redirect_link_id=link_id, after_id=after_id, limit=limit
+        )
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@app.get(
+    "/projects/{project_id}/redirect-links/{link_id}/clicks/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+def stream_click_events(
+    project_id: int,
+    link_id: int,
+    after_id: int | None = None,
+    store: DatabaseStore = Depends(get_read_store),
+    _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
+) -> StreamingResponse:
+    try:
+        store.get_project(project_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return ndjson_response(
+        lambda stream_store: stream_store.iter_click_events(
+            project_id, redirect_link_id=link_id, after_id=after_id
+        )
+    )
+
+
 @app.get("/r/{slug}")
 def resolve_redirect(
     slug: str,
@@ -306,6 +373,8 @@ def create_brand_config(
         return store.create_brand_config(project_id, payload)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
 
 
 @app.get(
@@ -314,7 +383,7 @@ def create_brand_config(
 )
 def list_brand_config_history(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.BrandConfigHistory]:
     try:
@@ -442,11 +511,28 @@ def create_source(
 @app.get("/projects/{project_id}/sources", response_model=list[schemas.Source])
 def list_sources(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.Source]:
     try:
-        return store.list_sources(project_id)
+        return store.list_sources(project_id, after_id, limit)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.get(
+    "/projects/{project_id}/sources/{source_id}", response_model=schemas.Source
+)
+def get_source(
+    project_id: int,
+    source_id: int,
+    store: DatabaseStore = Depends(get_read_store),
+    _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
+) -> schemas.Source:
+    try:
+        return store.get_source(project_id, source_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -518,11 +604,13 @@ def create_atom(
 @app.get("/projects/{project_id}/atoms", response_model=list[schemas.Atom])
 def list_atoms(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.Atom]:
     try:
-        return store.list_atoms(project_id)
+        return store.list_atoms(project_id, after_id, limit)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -543,7 +631,7 @@ def create_topic(
 @app.get("/projects/{project_id}/topics", response_model=list[schemas.Topic])
 def list_topics(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.Topic]:
     try:
@@ -570,7 +658,7 @@ def create_content_pack(
 )
 def list_content_packs(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.ContentPack]:
     try:
@@ -599,11 +687,28 @@ def create_content_item(
 )
 def list_content_items(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.ContentItem]:
     try:
-        return store.list_content_items(project_id)
+        return store.list_content_items(project_id, after_id, limit)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.get(
+    "/projects/{project_id}/content-items/expanded",
+    response_model=list[schemas.ContentItemExpanded],
+)
+def list_content_items_expanded(
+    project_id: int,
+    store: DatabaseStore = Depends(get_read_store),
+    _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
+) -> list[schemas.ContentItemExpanded]:
+    try:
+        return store.list_content_items_expanded(project_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -680,7 +785,7 @@ def create_qc_report(
 @app.get("/projects/{project_id}/qc-reports", response_model=list[schemas.QcReport])
 def list_qc_reports(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.QcReport]:
     try:
@@ -702,6 +807,8 @@ def create_publication(
         return store.create_publication(project_id, payload)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
 
 
 @app.get(
@@ -709,11 +816,13 @@ def create_publication(
 )
 def list_publications(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.Publication]:
     try:
-        return store.list_publications(project_id)
+        return store.list_publications(project_id, after_id, limit)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -752,11 +861,13 @@ def collect_metrics(
 )
 def list_metric_snapshots(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.MetricSnapshot]:
     try:
-        return store.list_metric_snapshots(project_id)
+        return store.list_metric_snapshots(project_id, after_id, limit)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -782,11 +893,13 @@ def create_learning_event(
 )
 def list_learning_events(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.LearningEvent]:
     try:
-        return store.list_learning_events(project_id)
+        return store.list_learning_events(project_id, after_id, limit)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -889,11 +1002,13 @@ def create_budget_usage(
 )
 def list_budget_usages(
     project_id: int,
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
     store: DatabaseStore = Depends(get_store),
     _: schemas.User = Depends(auth.require_roles("Admin")),
 ) -> list[schemas.BudgetUsage]:
     try:
-        return store.list_budget_usages(project_id)
+        return store.list_budget_usages(project_id, after_id, limit)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
@@ -977,6 +1092,8 @@ def create_prompt_version(
         return store.create_prompt_version(project_id, payload)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
 
 
 @app.get(
@@ -985,7 +1102,7 @@ def create_prompt_version(
 )
 def list_prompt_version_history(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.PromptVersionHistory]:
     try:
@@ -1035,7 +1152,7 @@ def rollback_prompt_version(
 )
 def list_prompt_versions(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.PromptVersion]:
     try:
@@ -1126,11 +1243,33 @@ def delete_integration_token(
 @app.get("/projects/{project_id}/alerts", response_model=list[schemas.Alert])
 def list_alerts(
     project_id: int,
-    store: DatabaseStore = Depends(get_store),
+    after_id: int | None = None,
+    limit: int | None = Query(None, ge=1, le=1000),
+    store: DatabaseStore = Depends(get_read_store),
     _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
 ) -> list[schemas.Alert]:
     service = AlertService(store)
     try:
-        return service.store.list_alerts(project_id)
+        return service.store.list_alerts(project_id, after_id=after_id, limit=limit)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+
+
+@app.get(
+    "/projects/{project_id}/alerts/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+def stream_alerts(
+    project_id: int,
+    after_id: int | None = None,
+    store: DatabaseStore = Depends(get_read_store),
+    _: schemas.User = Depends(auth.require_roles("Admin", "Editor", "Viewer")),
+) -> StreamingResponse:
+    try:
+        store.get_project(project_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    return ndjson_response(
+        lambda stream_store: stream_store.iter_alerts(project_id, after_id=after_id)
+    )
@@ -5,20 +5,37 @@ from typing import Optional
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
-    JSON,
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import UserDefinedType
 
 from .db import Base
 
+EMBEDDING_DIMENSION = 1536
+
+
+class HalfVector(UserDefinedType):
+    """pgvector ``halfvec`` type, used to cast embeddings for FP16 ANN search."""
+
+    cache_ok = True
+
+    def __init__(self, dim: int) -> None:
+        self.dim = dim
+
+    def get_col_spec(self, **kw) -> str:
+        return f"HALFVEC({self.dim})"
+
 
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(
@@ -124,8 +141,9 @@ class User(Base, TimestampMixin):
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # to_user_schema always reads the role names, so load them with the user.
     user_roles: Mapped[list[UserRole]] = relationship(
-        back_populates="user", cascade="all, delete-orphan"
+        back_populates="user", cascade="all, delete-orphan", lazy="selectin"
     )
 
 
@@ -138,11 +156,20 @@ class UserRole(Base):
     role_id: Mapped[int] = mapped_column(ForeignKey("roles.id"))
 
     user: Mapped[User] = relationship(back_populates="user_roles")
-    role: Mapped[Role] = relationship(back_populates="user_roles")
+    role: Mapped[Role] = relationship(back_populates="user_roles", lazy="joined")
 
 
 class BrandConfig(Base, TimestampMixin):
     __tablename__ = "brand_configs"
+    __table_args__ = (
+        UniqueConstraint("project_id", "version", name="uniq_brand_config_version"),
+        Index(
+            "uq_brand_configs_active",
+            "project_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -151,9 +178,9 @@ class BrandConfig(Base, TimestampMixin):
     is_stable: Mapped[bool] = mapped_column(Boolean, default=False)
     tone: Mapped[str] = mapped_column(String(255))
     audience: Mapped[str] = mapped_column(String(255))
-    offers: Mapped[list] = mapped_column(JSON, default=list)
-    rubrics: Mapped[list] = mapped_column(JSON, default=list)
-    forbidden: Mapped[list] = mapped_column(JSON, default=list)
+    offers: Mapped[list] = mapped_column(JSONB, default=list)
+    rubrics: Mapped[list] = mapped_column(JSONB, default=list)
+    forbidden: Mapped[list] = mapped_column(JSONB, default=list)
     cta_policy: Mapped[str] = mapped_column(Text)
 
     project: Mapped[Project] = relationship(back_populates="brand_configs")
@@ -167,7 +194,7 @@ class BrandConfigHistory(Base, TimestampMixin):
     brand_config_id: Mapped[int] = mapped_column(ForeignKey("brand_configs.id"))
     version: Mapped[int] = mapped_column(Integer)
     change_summary: Mapped[Optional[str]] = mapped_column(Text)
-    change_payload: Mapped[dict] = mapped_column(JSON, default=dict)
+    change_payload: Mapped[dict] = mapped_column(JSONB, default=dict)
 
     project: Mapped[Project] = relationship(back_populates="brand_config_history")
     brand_config: Mapped[BrandConfig] = relationship()
@@ -200,7 +227,7 @@ class ProjectVectorIndex(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(128))
     provider: Mapped[str] = mapped_column(String(64), default="pgvector")
     embedding_dimension: Mapped[int] = mapped_column(Integer, default=1536)
-    metadata: Mapped[dict] = mapped_column(JSON, default=dict)
+    metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
 
     project: Mapped[Project] = relationship(back_populates="vector_indexes")
 
@@ -225,6 +252,14 @@ class Budget(Base, TimestampMixin):
 
 class BudgetUsage(Base, TimestampMixin):
     __tablename__ = "budget_usages"
+    __table_args__ = (
+        Index(
+            "ix_budget_usages_project_date",
+            "project_id",
+            "usage_date",
+            postgresql_include=["token_used", "video_seconds_used", "publications_used"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     budget_id: Mapped[int] = mapped_column(ForeignKey("budgets.id"))
@@ -246,10 +281,11 @@ class Source(Base, TimestampMixin):
     title: Mapped[str] = mapped_column(String(255))
     source_type: Mapped[str] = mapped_column(String(64))
     uri: Mapped[Optional[str]] = mapped_column(Text)
-    content: Mapped[Optional[str]] = mapped_column(Text)
+    # Raw source text can be large; only detail reads undefer it.
+    content: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
     artifact_uri: Mapped[Optional[str]] = mapped_column(Text)
     artifact_version: Mapped[int] = mapped_column(Integer, default=1)
-    artifact_metadata: Mapped[dict] = mapped_column(JSON, default=dict)
+    artifact_metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
     status: Mapped[str] = mapped_column(String(32), default="new")
     is_current: Mapped[bool] = mapped_column(Boolean, default=True)
 
@@ -261,6 +297,19 @@ class Source(Base, TimestampMixin):
 
 class Atom(Base, TimestampMixin):
     __tablename__ = "atoms"
+    __table_args__ = (
+        # Embeddings are stored as written (float4) but indexed normalized and
+        # as halfvec: half the bytes per comparison, and inner product needs
+        # no norms.
+        Index(
+            "ix_atoms_embedding_halfvec_ip_hnsw",
+            text(
+                f"(l2_normalize(embedding)::halfvec({EMBEDDING_DIMENSION})) "
+                "halfvec_ip_ops"
+            ),
+            postgresql_using="hnsw",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -268,12 +317,14 @@ class Atom(Base, TimestampMixin):
     kind: Mapped[str] = mapped_column(String(64))
     text: Mapped[str] = mapped_column(Text)
     source_backed: Mapped[bool] = mapped_column(Boolean)
-    embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(1536))
+    embedding: Mapped[Optional[list[float]]] = mapped_column(
+        Vector(EMBEDDING_DIMENSION)
+    )
     source_uri: Mapped[Optional[str]] = mapped_column(Text)
     source_version: Mapped[Optional[int]] = mapped_column(Integer)
     artifact_uri: Mapped[Optional[str]] = mapped_column(Text)
     artifact_version: Mapped[Optional[int]] = mapped_column(Integer)
-    artifact_metadata: Mapped[dict] = mapped_column(JSON, default=dict)
+    artifact_metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
     status: Mapped[str] = mapped_column(String(32), default="new")
     is_current: Mapped[bool] = mapped_column(Boolean, default=True)
 
@@ -316,6 +367,10 @@ class ContentPack(Base, TimestampMixin):
 
 class ContentItem(Base, TimestampMixin):
     __tablename__ = "content_items"
+    __table_args__ = (
+        Index("ix_content_items_project", "project_id"),
+        Index("ix_content_items_pack", "pack_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -323,7 +378,7 @@ class ContentItem(Base, TimestampMixin):
     channel: Mapped[str] = mapped_column(String(64))
     format: Mapped[str] = mapped_column(String(64))
     body: Mapped[str] = mapped_column(Text)
-    metadata: Mapped[dict] = mapped_column(JSON, default=dict)
+    metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
     status: Mapped[str] = mapped_column(String(32), default="draft")
 
     project: Mapped[Project] = relationship(back_populates="content_items")
@@ -353,7 +408,7 @@ class QcReport(Base, TimestampMixin):
     content_item_id: Mapped[int] = mapped_column(ForeignKey("content_items.id"))
     score: Mapped[float] = mapped_column(Float)
     passed: Mapped[bool] = mapped_column(Boolean)
-    reasons: Mapped[list] = mapped_column(JSON, default=list)
+    reasons: Mapped[list] = mapped_column(JSONB, default=list)
 
     project: Mapped[Project] = relationship(back_populates="qc_reports")
     content_item: Mapped[ContentItem] = relationship(back_populates="qc_reports")
@@ -361,6 +416,26 @@ class QcReport(Base, TimestampMixin):
 
 class Publication(Base):
     __tablename__ = "publications"
+    __table_args__ = (
+        Index(
+            "ix_publications_due",
+            "project_id",
+            "scheduled_at",
+            postgresql_where=text("status = 'scheduled'"),
+        ),
+        Index(
+            "ix_publications_scheduled_at_due",
+            "scheduled_at",
+            postgresql_where=text("status = 'scheduled'"),
+        ),
+        Index(
+            "uq_publications_idempotency_key",
+            "project_id",
+            "idempotency_key",
+            unique=True,
+            postgresql_where=text("idempotency_key IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -381,6 +456,17 @@ class Publication(Base):
 
 class MetricSnapshot(Base):
     __tablename__ = "metrics_snapshots"
+    __table_args__ = (
+        Index("ix_metrics_snapshots_project_time", "project_id", "collected_at"),
+        Index("ix_metrics_snapshots_item_time", "content_item_id", "collected_at"),
+        # Append-only, so rows are physically ordered by time: a BRIN index
+        # serves time-window scans at a tiny fraction of a btree's size.
+        Index(
+            "ix_metrics_snapshots_collected_at_brin",
+            "collected_at",
+            postgresql_using="brin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -408,7 +494,7 @@ class RedirectLink(Base, TimestampMixin):
     )
     slug: Mapped[str] = mapped_column(String(64), unique=True)
     target_url: Mapped[str] = mapped_column(Text)
-    utm_params: Mapped[dict] = mapped_column(JSON, default=dict)
+    utm_params: Mapped[dict] = mapped_column(JSONB, default=dict)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     project: Mapped[Project] = relationship(back_populates="redirect_links")
@@ -422,6 +508,16 @@ class RedirectLink(Base, TimestampMixin):
 
 class ClickEvent(Base):
     __tablename__ = "click_events"
+    __table_args__ = (
+        Index("ix_click_events_project_item", "project_id", "content_item_id"),
+        Index("ix_click_events_link_time", "redirect_link_id", "clicked_at"),
+        Index(
+            "ix_click_events_utm_params_gin", "utm_params", postgresql_using="gin"
+        ),
+        Index(
+            "ix_click_events_clicked_at_brin", "clicked_at", postgresql_using="brin"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -432,8 +528,8 @@ class ClickEvent(Base):
     ip_address: Mapped[Optional[str]] = mapped_column(String(64))
     user_agent: Mapped[Optional[str]] = mapped_column(Text)
     referrer: Mapped[Optional[str]] = mapped_column(Text)
-    utm_params: Mapped[dict] = mapped_column(JSON, default=dict)
-    query_params: Mapped[dict] = mapped_column(JSON, default=dict)
+    utm_params: Mapped[dict] = mapped_column(JSONB, default=dict)
+    query_params: Mapped[dict] = mapped_column(JSONB, default=dict)
     clicked_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=datetime.utcnow
     )
@@ -466,7 +562,7 @@ class AutoLearningConfig(Base, TimestampMixin):
     max_changes_per_week: Mapped[int] = mapped_column(Integer, default=2)
     rollback_threshold: Mapped[float] = mapped_column(Float, default=0.02)
     rollback_window: Mapped[int] = mapped_column(Integer, default=20)
-    protected_parameters: Mapped[list] = mapped_column(JSON, default=list)
+    protected_parameters: Mapped[list] = mapped_column(JSONB, default=list)
 
     project: Mapped[Project] = relationship(back_populates="auto_learning_config")
 
@@ -476,8 +572,8 @@ class AutoLearningState(Base, TimestampMixin):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"), unique=True)
-    parameters: Mapped[dict] = mapped_column(JSON, default=dict)
-    stable_parameters: Mapped[dict] = mapped_column(JSON, default=dict)
+    parameters: Mapped[dict] = mapped_column(JSONB, default=dict)
+    stable_parameters: Mapped[dict] = mapped_column(JSONB, default=dict)
     window_started_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True)
     )
@@ -490,6 +586,18 @@ class AutoLearningState(Base, TimestampMixin):
 
 class PromptVersion(Base, TimestampMixin):
     __tablename__ = "prompt_versions"
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "prompt_key", "version", name="uniq_prompt_version"
+        ),
+        Index(
+            "uq_prompt_versions_active",
+            "project_id",
+            "prompt_key",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     project_id: Mapped[int] = mapped_column(ForeignKey("projects.id"))
@@ -511,7 +619,7 @@ class PromptVersionHistory(Base, TimestampMixin):
     prompt_key: Mapped[str] = mapped_column(String(255))
     version: Mapped[int] = mapped_column(Integer)
     change_summary: Mapped[Optional[str]] = mapped_column(Text)
-    change_payload: Mapped[dict] = mapped_column(JSON, default=dict)
+    change_payload: Mapped[dict] = mapped_column(JSONB, default=dict)
 
     project: Mapped[Project] = relationship(back_populates="prompt_version_history")
     prompt_version: Mapped[PromptVersion] = relationship()
@@ -542,6 +650,6 @@ class Alert(Base, TimestampMixin):
     alert_type: Mapped[str] = mapped_column(String(64))
     severity: Mapped[str] = mapped_column(String(32))
     message: Mapped[str] = mapped_column(Text)
-    metadata: Mapped[dict] = mapped_column(JSON, default=dict)
+    metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
 
     project: Mapped[Project] = relationship(back_populates="alerts")
@@ -1,7 +1,7 @@
 from datetime import date, datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
 class TokenResponse(BaseModel):
@@ -15,6 +15,8 @@ class ProjectCreate(BaseModel):
 
 
 class Project(ProjectCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     status: str = "active"
     created_at: datetime
@@ -32,6 +34,8 @@ class BrandConfigCreate(BaseModel):
 
 
 class BrandConfig(BrandConfigCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     version: int
@@ -40,6 +44,8 @@ class BrandConfig(BrandConfigCreate):
 
 
 class BrandConfigHistory(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     brand_config_id: int
@@ -64,6 +70,8 @@ class BudgetCreate(BaseModel):
 
 
 class Budget(BudgetCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
@@ -82,6 +90,8 @@ class SourceCreate(BaseModel):
 
 
 class Source(SourceCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
@@ -115,6 +125,8 @@ class AtomCreate(BaseModel):
 
 
 class Atom(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     source_id: int
@@ -151,6 +163,8 @@ class TopicCreate(BaseModel):
 
 
 class Topic(TopicCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     status: str = "planned"
@@ -163,6 +177,8 @@ class ContentPackCreate(BaseModel):
 
 
 class ContentPack(ContentPackCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     status: str = "queued"
@@ -178,6 +194,8 @@ class ContentItemCreate(BaseModel):
 
 
 class ContentItem(ContentItemCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     status: str = "draft"
@@ -217,6 +235,8 @@ class QcReportCreate(BaseModel):
 
 
 class QcReport(QcReportCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
@@ -231,6 +251,8 @@ class PublicationCreate(BaseModel):
 
 
 class Publication(PublicationCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     platform_post_id: Optional[str] = None
@@ -250,11 +272,19 @@ class MetricSnapshotCreate(BaseModel):
 
 
 class MetricSnapshot(MetricSnapshotCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     collected_at: datetime
 
 
+class ContentItemExpanded(ContentItem):
+    qc_reports: List[QcReport] = Field(default_factory=list)
+    publications: List[Publication] = Field(default_factory=list)
+    metric_snapshots: List[MetricSnapshot] = Field(default_factory=list)
+
+
 class RedirectLinkCreate(BaseModel):
     content_item_id: Optional[int] = None
     target_url: str
@@ -264,12 +294,20 @@ class RedirectLinkCreate(BaseModel):
 
 
 class RedirectLink(RedirectLinkCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
 
 
+class RedirectLinkStats(RedirectLink):
+    click_count: int = 0
+
+
 class ClickEvent(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     redirect_link_id: int
@@ -307,6 +345,8 @@ class LearningEventCreate(BaseModel):
 
 
 class LearningEvent(LearningEventCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
@@ -320,12 +360,16 @@ class AutoLearningConfigCreate(BaseModel):
 
 
 class AutoLearningConfig(AutoLearningConfigCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
 
 
 class AutoLearningState(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     parameters: dict = Field(default_factory=dict)
@@ -346,6 +390,8 @@ class PromptVersionCreate(BaseModel):
 
 
 class PromptVersion(PromptVersionCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     version: int
@@ -353,6 +399,8 @@ class PromptVersion(PromptVersionCreate):
 
 
 class PromptVersionHistory(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     prompt_version_id: int
@@ -374,6 +422,8 @@ class StableVersionUpdate(BaseModel):
 
 
 class ProjectDataset(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     name: str
@@ -384,6 +434,8 @@ class ProjectDataset(BaseModel):
 
 
 class ProjectVectorIndex(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     name: str
@@ -402,6 +454,8 @@ class BudgetUsageCreate(BaseModel):
 
 
 class BudgetUsage(BudgetUsageCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
@@ -433,6 +487,8 @@ class BudgetReport(BaseModel):
 
 
 class Role(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     created_at: datetime
@@ -488,6 +544,8 @@ class AlertCreate(BaseModel):
 
 
 class Alert(AlertCreate):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     project_id: int
     created_at: datetime
@@ -212,8 +212,8 @@ class IntegrationMonitor:
                         timeout=self.timeout,
                         sora_base_url=self.sora_base_url,
                     )
-                    for project in store.list_projects():
-                        checker.check_project(project.id)
+                    for project_id in store.list_project_ids():
+                        checker.check_project(project_id)
             except Exception as exc:
                 log_event(
                     self.logger,
@@ -110,13 +110,14 @@ class IngestService:
         self, project_id: int, atoms: Iterable[schemas.AtomCreate]
     ) -> List[schemas.Atom]:
         created: List[schemas.Atom] = []
+        embeddings: List[tuple[int, List[float]]] = []
         for atom_payload in atoms:
             atom = self.store.create_atom(project_id, atom_payload)
-            if self.vector_store and atom_payload.embedding is not None:
-                self.vector_store.upsert_atom_embedding(
-                    project_id, atom.id, atom_payload.embedding
-                )
+            if atom_payload.embedding is not None:
+                embeddings.append((atom.id, atom_payload.embedding))
             created.append(atom)
+        if self.vector_store:
+            self.vector_store.upsert_atom_embeddings_bulk(project_id, embeddings)
         return created
 
     def ingest_source(
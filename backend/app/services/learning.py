@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from sqlalchemy import select
 
@@ -32,7 +32,7 @@ class AutoLearningService:
         updated_state = self._ensure_baseline(updated_state)
 
         rollback_applied = False
-        recent_snapshots = self.store.list_recent_metric_snapshots(
+        recent_snapshots = self.store.iter_recent_metric_snapshots(
             project_id, config.rollback_window
         )
         avg_ctr = self._average_ctr(recent_snapshots)
@@ -181,14 +181,16 @@ class AutoLearningService:
             best[key] = best_value
         return best
 
-    def _average_ctr(self, snapshots: list[models.MetricSnapshot]) -> Optional[float]:
+    def _average_ctr(
+        self, snapshots: Iterable[schemas.MetricSnapshot]
+    ) -> Optional[float]:
         values = [ctr for snapshot in snapshots if (ctr := self._ctr(snapshot)) is not None]
         if not values:
             return None
         return sum(values) / len(values)
 
     @staticmethod
-    def _ctr(snapshot: models.MetricSnapshot) -> Optional[float]:
+    def _ctr(snapshot: schemas.MetricSnapshot) -> Optional[float]:
         if snapshot.impressions <= 0:
             return None
         return snapshot.clicks / snapshot.impressions
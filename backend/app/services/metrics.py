@@ -21,10 +21,16 @@ class MetricsCollector:
 
     def collect(self, project_id: int) -> MetricsResult:
         snapshots: list[schemas.MetricSnapshot] = []
-        publications = self.store.list_publications(project_id)
+        publications = [
+            publication
+            for publication in self.store.list_publications(project_id)
+            if publication.status == "published" and publication.platform_post_id
+        ]
+        clicks_by_item = self.store.count_clicks_bulk(
+            project_id,
+            list({publication.content_item_id for publication in publications}),
+        )
         for publication in publications:
-            if publication.status != "published" or not publication.platform_post_id:
-                continue
             metrics = None
             if publication.platform == "telegram":
                 metrics = self._collect_telegram_metrics(project_id, publication)
@@ -32,7 +38,7 @@ class MetricsCollector:
                 metrics = self._collect_vk_metrics(project_id, publication)
             if metrics is None:
                 continue
-            clicks = self.store.count_clicks(project_id, publication.content_item_id)
+            clicks = clicks_by_item.get(publication.content_item_id, 0)
             metrics["clicks"] = max(metrics.get("clicks", 0), clicks)
             snapshot = self.store.create_metric_snapshot(
                 project_id,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, Optional, Protocol, Sequence
 from urllib import parse, request
 
 from sqlalchemy import select
@@ -25,6 +25,12 @@ class TaskQueue(Protocol):
     ) -> str:
         ...
 
+    def enqueue_many(
+        self,
+        tasks: Sequence[tuple[str, dict, Optional[datetime], Optional[str]]],
+    ) -> list[str]:
+        ...
+
 
 @dataclass(frozen=True)
 class PublicationResult:
@@ -51,6 +57,54 @@ class PublicationScheduler:
             )
         return len(due)
 
+    def tick_all(
+        self,
+        now: Optional[datetime] = None,
+        limit: int = 500,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> int:
+        """Ставит в очередь просроченные публикации проектов шарда за один запрос."""
+        now = now or datetime.utcnow()
+        due = self.store.claim_due_publications(now, limit, shard, shards)
+        self.task_queue.enqueue_many(
+            [
+                (
+                    "publish_content",
+                    {
+                        "publication_id": publication.id,
+                        "project_id": publication.project_id,
+                    },
+                    now,
+                    f"publication-{publication.id}",
+                )
+                for publication in due
+            ]
+        )
+        return len(due)
+
+    def dispatch(
+        self, publication_ids: Sequence[int], now: Optional[datetime] = None
+    ) -> int:
+        """Ставит в очередь те из указанных публикаций, что уже подошли по времени."""
+        now = now or datetime.utcnow()
+        due = self.store.claim_due_publications_by_id(publication_ids, now)
+        self.task_queue.enqueue_many(
+            [
+                (
+                    "publish_content",
+                    {
+                        "publication_id": publication.id,
+                        "project_id": publication.project_id,
+                    },
+                    now,
+                    f"publication-{publication.id}",
+                )
+                for publication in due
+            ]
+        )
+        return len(due)
+
 
 class PublisherService:
     """Сервис автопубликации: ретраи, дедупликация и идемпотентность."""
@@ -233,13 +287,18 @@ class PublisherService:
                 },
             )
         else:
+            delay_seconds = min(
+                self.retry_delay_seconds * (2 ** (publication.attempt_count - 1)),
+                self.max_retry_delay_seconds,
+            )
+            run_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+            # The retry time becomes the new schedule, so neither the tick nor
+            # the due-publication trigger picks the row up before the backoff
+            # ends; with a deferred job already queued the row is "queued".
+            publication.scheduled_at = run_at
             publication.status = "scheduled"
             if self.task_queue:
-                delay_seconds = min(
-                    self.retry_delay_seconds * (2 ** (publication.attempt_count - 1)),
-                    self.max_retry_delay_seconds,
-                )
-                run_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+                publication.status = "queued"
                 self.task_queue.enqueue(
                     "publish_content",
                     {"publication_id": publication.id, "project_id": publication.project_id},
@@ -38,10 +38,8 @@ class RedirectService:
         query_params = dict(request.query_params)
         utm_params = self._extract_utm_params(query_params, link.utm_params or {})
         redirect_url = self._build_redirect_url(link.target_url, utm_params, query_params)
-        event = self.store.create_click_event(
-            project_id=link.project_id,
-            redirect_link_id=link.id,
-            content_item_id=link.content_item_id,
+        event = self.store.record_click(
+            link,
             ip_address=request.client.host if request.client else None,
             user_agent=request.headers.get("user-agent"),
             referrer=request.headers.get("referer"),
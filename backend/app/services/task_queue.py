@@ -2,17 +2,61 @@ from __future__ import annotations
 
 import asyncio
 import os
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Coroutine, Optional, Sequence
+from uuid import uuid4
 
-from arq.connections import RedisSettings, create_pool
+from arq.connections import ArqRedis, RedisSettings, create_pool
+from arq.constants import job_key_prefix, result_key_prefix
+from arq.jobs import serialize_job
+from arq.utils import timestamp_ms, to_unix_ms
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+ARQ_QUEUE_NAME = os.getenv("ARQ_QUEUE_NAME", "contentzavod")
+
+
+@lru_cache
+def redis_settings(redis_url: str = REDIS_URL) -> RedisSettings:
+    # Parsed once per URL instead of on every pool the API opens.
+    return RedisSettings.from_dsn(redis_url)
+
+
+# Mirrors arq's enqueue_job for a batch: skip jobs whose job or result key
+# exists, otherwise store the serialized job and score it on the queue.
+# ARGV is the two key prefixes followed by (job_id, job, expires_ms, score)
+# per job. Script objects call EVALSHA and load the script on first miss.
+_BULK_ENQUEUE_SCRIPT = """
+local enqueued = 0
+for i = 3, #ARGV, 4 do
+    local job_id = ARGV[i]
+    local job_key = ARGV[1] .. job_id
+    if redis.call('EXISTS', job_key, ARGV[2] .. job_id) == 0 then
+        redis.call('SET', job_key, ARGV[i + 1], 'PX', ARGV[i + 2])
+        redis.call('ZADD', KEYS[1], ARGV[i + 3], job_id)
+        enqueued = enqueued + 1
+    end
+end
+return enqueued
+"""
 
 
 @dataclass(frozen=True)
 class ArqTaskQueue:
-    redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    queue_name: str = os.getenv("ARQ_QUEUE_NAME", "contentzavod")
+    redis_url: str = REDIS_URL
+    queue_name: str = ARQ_QUEUE_NAME
+    # Inside the worker, jobs run on executor threads while the arq pool lives
+    # on the worker's event loop; with both set, enqueues are handed to that
+    # loop and reuse its connection instead of opening a pool per call.
+    redis: Optional[ArqRedis] = None
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        if self.loop is not None:
+            return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+        return asyncio.run(coro)
 
     def enqueue(
         self,
@@ -21,10 +65,30 @@ class ArqTaskQueue:
         run_at: Optional[datetime] = None,
         idempotency_key: Optional[str] = None,
     ) -> str:
-        return asyncio.run(
+        return self._run(
             self._enqueue_async(task_name, payload, run_at, idempotency_key)
         )
 
+    def enqueue_many(
+        self,
+        tasks: Sequence[tuple[str, dict, Optional[datetime], Optional[str]]],
+    ) -> list[str]:
+        if not tasks:
+            return []
+        return self._run(self._enqueue_many_async(tasks))
+
+    @asynccontextmanager
+    async def _pool(self) -> AsyncIterator[ArqRedis]:
+        if self.redis is not None:
+            yield self.redis
+            return
+        redis = await create_pool(redis_settings(self.redis_url))
+        try:
+            yield redis
+        finally:
+            redis.close()
+            await redis.wait_closed()
+
     async def _enqueue_async(
         self,
         task_name: str,
@@ -32,12 +96,10 @@ class ArqTaskQueue:
         run_at: Optional[datetime],
         idempotency_key: Optional[str],
     ) -> str:
-        redis = await create_pool(RedisSettings.from_dsn(self.redis_url))
-        try:
+        async with self._pool() as redis:
             job_id = idempotency_key
             defer_until = None
-            now = datetime.utcnow()
-            if run_at and run_at > now:
+            if run_at and run_at > datetime.utcnow():
                 defer_until = run_at
             job = await redis.enqueue_job(
                 task_name,
@@ -49,6 +111,36 @@ class ArqTaskQueue:
             if job:
                 return job.job_id
             return job_id or ""
-        finally:
-            redis.close()
-            await redis.wait_closed()
+
+    async def _enqueue_many_async(
+        self, tasks: Sequence[tuple[str, dict, Optional[datetime], Optional[str]]]
+    ) -> list[str]:
+        # The whole batch is one EVALSHA: Redis runs the dedup check and the
+        # job/queue writes for every job atomically, so a tick costs a single
+        # round trip however many publications are due.
+        async with self._pool() as redis:
+            now = datetime.utcnow()
+            enqueue_time_ms = timestamp_ms()
+            job_ids = [idempotency_key or uuid4().hex for *_, idempotency_key in tasks]
+            args: list[Any] = [job_key_prefix, result_key_prefix]
+            for (task_name, payload, run_at, _), job_id in zip(tasks, job_ids):
+                score = enqueue_time_ms
+                if run_at and run_at > now:
+                    score = to_unix_ms(run_at)
+                args += [
+                    job_id,
+                    serialize_job(
+                        task_name,
+                        (),
+                        payload,
+                        None,
+                        enqueue_time_ms,
+                        serializer=redis.job_serializer,
+                    ),
+                    score - enqueue_time_ms + redis.expires_extra_ms,
+                    score,
+                ]
+            await redis.register_script(_BULK_ENQUEUE_SCRIPT)(
+                keys=[self.queue_name], args=args
+            )
+            return job_ids
@@ -1,40 +1,442 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import List, Optional
-
-from sqlalchemy import desc, func, select
-from sqlalchemy.orm import Session
+from functools import lru_cache
+from operator import attrgetter
+from threading import Lock
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Sequence
+
+import redis
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import (
+    Executable,
+    Insert,
+    ScalarSelect,
+    Select,
+    String,
+    bindparam,
+    cast,
+    desc,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased, selectinload, undefer
 
 from . import models, schemas
+from .observability import get_logger
 from .security import decrypt_secret, encrypt_secret
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BudgetUsageTotals:
     token_used: int
     video_seconds_used: int
     publications_used: int
 
 
+@dataclass(frozen=True, slots=True)
+class AtomDTO:
+    """Lightweight atom row for internal consumers that skip API validation."""
+
+    id: int
+    project_id: int
+    source_id: int
+    kind: str
+    text: str
+    source_backed: bool
+    source_uri: Optional[str]
+    source_version: Optional[int]
+    artifact_uri: Optional[str]
+    artifact_version: Optional[int]
+    artifact_metadata: dict
+    status: str
+    is_current: bool
+    created_at: datetime
+
+
+_ATOM_DTO_COLUMNS = tuple(
+    getattr(models.Atom, field.name) for field in fields(AtomDTO)
+)
+
+
+def _schema_columns(schema_cls: type[BaseModel], model_cls: type) -> tuple:
+    columns = model_cls.__table__.columns
+    return tuple(columns[name] for name in schema_cls.model_fields if name in columns)
+
+
+_SOURCE_COLUMNS = _schema_columns(schemas.Source, models.Source)
+_SOURCE_LIST_COLUMNS = tuple(
+    column for column in _SOURCE_COLUMNS if column.name != "content"
+)
+_ATOM_COLUMNS = _schema_columns(schemas.Atom, models.Atom)
+_METRIC_SNAPSHOT_COLUMNS = _schema_columns(schemas.MetricSnapshot, models.MetricSnapshot)
+_PROMPT_VERSION_COLUMNS = _schema_columns(schemas.PromptVersion, models.PromptVersion)
+_PROMPT_VERSION_HISTORY_COLUMNS = _schema_columns(
+    schemas.PromptVersionHistory, models.PromptVersionHistory
+)
+_REDIRECT_LINK_COLUMNS = _schema_columns(schemas.RedirectLink, models.RedirectLink)
+_CLICK_EVENT_COLUMNS = _schema_columns(schemas.ClickEvent, models.ClickEvent)
+_ALERT_COLUMNS = _schema_columns(schemas.Alert, models.Alert)
+_INTEGRATION_TOKEN_COLUMNS = tuple(models.IntegrationToken.__table__.columns)
+
+
+def _construct_mapper(
+    schema_cls: type[BaseModel], model_cls: type
+) -> Callable[[Any], BaseModel]:
+    # ORM rows already satisfy the schema, so validation is skipped and the
+    # attributes are read in one C-level attrgetter call.
+    names = tuple(column.name for column in _schema_columns(schema_cls, model_cls))
+    get_attrs = attrgetter(*names)
+    construct = schema_cls.model_construct
+
+    def mapper(row: Any) -> BaseModel:
+        return construct(**dict(zip(names, get_attrs(row))))
+
+    return mapper
+
+
+_STREAM_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema_cls: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema_cls])
+
+_BRAND_CONFIG_SNAPSHOT_FIELDS = (
+    "id",
+    "version",
+    "is_active",
+    "is_stable",
+    "tone",
+    "audience",
+    "offers",
+    "rubrics",
+    "forbidden",
+    "cta_policy",
+)
+_get_brand_config_snapshot = attrgetter(*_BRAND_CONFIG_SNAPSHOT_FIELDS)
+
+_PROMPT_SNAPSHOT_FIELDS = (
+    "id",
+    "prompt_key",
+    "version",
+    "is_active",
+    "is_stable",
+    "content",
+)
+_get_prompt_snapshot = attrgetter(*_PROMPT_SNAPSHOT_FIELDS)
+_PROMPT_SNAPSHOT_COLUMNS = tuple(
+    getattr(models.PromptVersion, name) for name in _PROMPT_SNAPSHOT_FIELDS
+)
+_VERSION_INSERT_ATTEMPTS = 3
+# Version writes for a project are serialized with a transaction-scoped
+# advisory lock keyed (namespace, project_id); the two-key form keeps it apart
+# from the single-key locks taken elsewhere (e.g. the publication listener).
+_VERSION_LOCK_NAMESPACE = 0x76657273  # "vers"
+_LOCK_PROJECT_VERSIONS = select(
+    func.pg_advisory_xact_lock(_VERSION_LOCK_NAMESPACE, bindparam("project_id"))
+)
+
+_INSERT_BUDGET = insert(models.Budget).returning(models.Budget)
+_INSERT_BUDGET_USAGE = insert(models.BudgetUsage).returning(models.BudgetUsage)
+_INSERT_SOURCE = insert(models.Source).returning(*_SOURCE_COLUMNS)
+_INSERT_ATOM = insert(models.Atom).returning(models.Atom)
+_INSERT_TOPIC = insert(models.Topic).returning(models.Topic)
+_INSERT_CONTENT_PACK = insert(models.ContentPack).returning(models.ContentPack)
+_INSERT_CONTENT_ITEM = insert(models.ContentItem).returning(models.ContentItem)
+_INSERT_QC_REPORT = insert(models.QcReport).returning(models.QcReport)
+# A concurrent schedule() with the same idempotency key loses the race on
+# uq_publications_idempotency_key and re-reads the winner's row instead.
+_INSERT_PUBLICATION = (
+    pg_insert(models.Publication)
+    .on_conflict_do_nothing(
+        index_elements=["project_id", "idempotency_key"],
+        index_where=models.Publication.idempotency_key.isnot(None),
+    )
+    .returning(models.Publication)
+)
+_INSERT_METRIC_SNAPSHOT = insert(models.MetricSnapshot).returning(models.MetricSnapshot)
+_INSERT_LEARNING_EVENT = insert(models.LearningEvent).returning(models.LearningEvent)
+_INSERT_REDIRECT_LINK = insert(models.RedirectLink).returning(models.RedirectLink)
+_INSERT_CLICK_EVENT = insert(models.ClickEvent).returning(models.ClickEvent)
+_INSERT_INTEGRATION_TOKEN = insert(models.IntegrationToken).returning(
+    models.IntegrationToken
+)
+_INSERT_ALERT = insert(models.Alert).returning(models.Alert)
+
+_SELECT_HAS_USERS = select(select(models.User.id).exists())
+_SELECT_USER_BY_EMAIL = select(models.User).where(
+    models.User.email == bindparam("email")
+)
+_SELECT_PROJECT_ID = select(models.Project.id).where(
+    models.Project.id == bindparam("project_id")
+)
+_SELECT_LATEST_BRAND_CONFIG = (
+    select(models.BrandConfig)
+    .where(models.BrandConfig.project_id == bindparam("project_id"))
+    .order_by(models.BrandConfig.version.desc())
+    .limit(1)
+)
+# Prompt lookups feeding history snapshots select plain column rows: the
+# snapshot keeps the pre-update values even after _deactivate synchronises
+# in-session objects, and no expired attribute can trigger a refresh.
+_SELECT_LATEST_PROMPT_VERSION = (
+    select(*_PROMPT_SNAPSHOT_COLUMNS)
+    .where(
+        models.PromptVersion.project_id == bindparam("project_id"),
+        models.PromptVersion.prompt_key == bindparam("prompt_key"),
+    )
+    .order_by(models.PromptVersion.version.desc())
+    .limit(1)
+)
+_SELECT_PROMPT_VERSION_AND_LATEST = (
+    select(*_PROMPT_SNAPSHOT_COLUMNS)
+    .where(
+        models.PromptVersion.project_id == bindparam("project_id"),
+        models.PromptVersion.prompt_key == bindparam("prompt_key"),
+        or_(
+            models.PromptVersion.version == bindparam("version"),
+            models.PromptVersion.version
+            == select(func.max(models.PromptVersion.version))
+            .where(
+                models.PromptVersion.project_id == bindparam("project_id"),
+                models.PromptVersion.prompt_key == bindparam("prompt_key"),
+            )
+            .scalar_subquery(),
+        ),
+    )
+    .order_by(models.PromptVersion.version.desc())
+)
+_SELECT_LATEST_BUDGET = (
+    select(models.Budget)
+    .where(models.Budget.project_id == bindparam("project_id"))
+    .order_by(models.Budget.created_at.desc())
+    .limit(1)
+)
+_SELECT_DUE_PUBLICATIONS = select(models.Publication).where(
+    models.Publication.project_id == bindparam("project_id"),
+    models.Publication.status == "scheduled",
+    models.Publication.scheduled_at <= bindparam("scheduled_before"),
+)
+# Claiming moves due rows to "queued" in the same statement, so the next tick
+# moves on to newer publications instead of re-reading the oldest ones.
+_CLAIM_DUE_PUBLICATIONS = (
+    update(models.Publication)
+    .where(
+        models.Publication.id.in_(
+            select(models.Publication.id)
+            .where(
+                models.Publication.status == "scheduled",
+                models.Publication.scheduled_at <= bindparam("scheduled_before"),
+                models.Publication.project_id % bindparam("shards")
+                == bindparam("shard"),
+            )
+            .order_by(models.Publication.scheduled_at)
+            .limit(bindparam("limit"))
+            .with_for_update(skip_locked=True)
+        )
+    )
+    .values(status="queued")
+    .returning(models.Publication)
+    .execution_options(synchronize_session=False, populate_existing=True)
+)
+_CLAIM_DUE_PUBLICATIONS_BY_ID = (
+    update(models.Publication)
+    .where(
+        models.Publication.id.in_(
+            select(models.Publication.id)
+            .where(
+                models.Publication.id.in_(bindparam("publication_ids", expanding=True)),
+                models.Publication.status == "scheduled",
+                models.Publication.scheduled_at <= bindparam("scheduled_before"),
+            )
+            .with_for_update(skip_locked=True)
+        )
+    )
+    .values(status="queued")
+    .returning(models.Publication)
+    .execution_options(synchronize_session=False, populate_existing=True)
+)
+_SELECT_REDIRECT_LINK_BY_SLUG = select(*_REDIRECT_LINK_COLUMNS).where(
+    models.RedirectLink.slug == bindparam("slug")
+)
+_SELECT_INTEGRATION_TOKEN_BY_PROVIDER = select(models.IntegrationToken).where(
+    models.IntegrationToken.project_id == bindparam("project_id"),
+    models.IntegrationToken.provider == bindparam("provider"),
+)
+
+
+class _ListCache:
+    """Process-local cache for rarely changing list results.
+
+    Entries are keyed by a per-project write version, so a bump on write
+    makes old entries unreachable and they age out of the LRU. Versions
+    live in this process only: after a write made by another API or worker
+    process, listings here may be up to LIST_CACHE_TTL_SECONDS stale. Set
+    the TTL to 0 to disable the cache where that is not acceptable.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._versions: dict[Optional[int], int] = defaultdict(int)
+        self._entries: OrderedDict[Hashable, tuple[float, tuple]] = OrderedDict()
+
+    def version(self, project_id: Optional[int]) -> int:
+        with self._lock:
+            return self._versions[project_id]
+
+    def bump(self, project_id: Optional[int]) -> None:
+        with self._lock:
+            self._versions[project_id] += 1
+
+    def get(self, key: Hashable) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, rows: list) -> None:
+        if self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, tuple(rows))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_LIST_CACHE = _ListCache(
+    maxsize=int(os.getenv("LIST_CACHE_SIZE", "256")),
+    ttl_seconds=float(os.getenv("LIST_CACHE_TTL_SECONDS", "30")),
+)
+
+
+class _RedirectLinkCache:
+    """Redis read-through cache for slug lookups on the redirect hot path.
+
+    Every store method that writes a redirect link must call ``delete`` for
+    its slug; the TTL only bounds how long a missed invalidation can serve
+    a stale link. Redis errors fall back to the database instead of failing
+    the redirect. The client is created on first use, so importing the
+    store never touches Redis.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int) -> None:
+        self._url = url
+        self._ttl_seconds = ttl_seconds
+        self._client: Optional[redis.Redis] = None
+        self._lock = Lock()
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        if self._ttl_seconds <= 0:
+            return None
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = redis.Redis.from_url(
+                        self._url, socket_timeout=0.1, socket_connect_timeout=0.5
+                    )
+        return self._client
+
+    def get(self, slug: str) -> Optional[schemas.RedirectLink]:
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            payload = client.get(f"rl:{slug}")
+        except redis.RedisError:
+            return None
+        if payload is None:
+            return None
+        return schemas.RedirectLink.model_validate_json(payload)
+
+    def set(self, link: schemas.RedirectLink) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            client.setex(f"rl:{link.slug}", self._ttl_seconds, link.model_dump_json())
+        except redis.RedisError:
+            pass
+
+    def delete(self, slug: str) -> None:
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            client.delete(f"rl:{slug}")
+        except redis.RedisError:
+            get_logger().warning(
+                "redirect_cache_invalidation_failed",
+                extra={"event": "redirect_cache_invalidation_failed", "slug": slug},
+            )
+
+
+_REDIRECT_LINKS = _RedirectLinkCache(
+    url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    ttl_seconds=int(os.getenv("REDIRECT_CACHE_TTL_SECONDS", "3600")),
+)
+
+
 class DatabaseStore:
     def __init__(self, session: Session) -> None:
         self.session = session
+        self._validated_projects: set[int] = set()
+        self._flush_enabled = True
         self.jwt_secret_key = os.getenv("JWT_SECRET_KEY", "change_me")
         self.jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
         self.jwt_expire_minutes = int(os.getenv("JWT_EXPIRE_MINUTES", "60"))
 
+    @contextmanager
+    def batch(self) -> Iterator["DatabaseStore"]:
+        """Defer unit-of-work flushes until the block exits.
+
+        Objects changed inside the block get database-generated values (ids,
+        onupdate timestamps) only after the single flush on exit, and Core or
+        bulk statements issued inside the block do not see those changes.
+        """
+        previous = self._flush_enabled
+        self._flush_enabled = False
+        try:
+            yield self
+        finally:
+            self._flush_enabled = previous
+        if previous:
+            self.session.flush()
+
+    def _flush(self) -> None:
+        if self._flush_enabled:
+            self.session.flush()
+
     def has_users(self) -> bool:
-        return bool(self.session.scalar(select(models.User.id)))
+        return bool(self.session.scalar(_SELECT_HAS_USERS))
 
     def get_user_by_email(self, email: str) -> Optional[models.User]:
-        return self.session.scalar(select(models.User).where(models.User.email == email))
+        return self.session.scalar(_SELECT_USER_BY_EMAIL, {"email": email})
 
     def list_users(self) -> List[schemas.User]:
         users = self.session.scalars(select(models.User)).all()
-        return [self.to_user_schema(user) for user in users]
+        return self._detach(users, self.to_user_schema)
 
     def create_role(self, name: str) -> models.Role:
         role = self.session.scalar(select(models.Role).where(models.Role.name == name))
@@ -42,12 +444,12 @@ class DatabaseStore:
             return role
         role = models.Role(name=name)
         self.session.add(role)
-        self.session.flush()
+        self._flush()
         return role
 
     def list_roles(self) -> List[schemas.Role]:
         roles = self.session.scalars(select(models.Role)).all()
-        return [self._to_role(role) for role in roles]
+        return self._detach(roles, self._to_role)
 
     def create_user(self, payload: schemas.UserCreate, password_hash: str) -> schemas.User:
         user = models.User(
@@ -56,84 +458,141 @@ class DatabaseStore:
             is_active=payload.is_active,
         )
         self.session.add(user)
-        for role_name in sorted(set(payload.roles)):
-            role = self.create_role(role_name)
+        for role in self._ensure_roles(sorted(set(payload.roles))):
             self.session.add(models.UserRole(user=user, role=role))
         self.session.flush()
         return self.to_user_schema(user)
 
+    def _ensure_roles(self, names: List[str]) -> List[models.Role]:
+        if not names:
+            return []
+        roles = {
+            role.name: role
+            for role in self.session.scalars(
+                select(models.Role).where(models.Role.name.in_(names))
+            )
+        }
+        missing = [name for name in names if name not in roles]
+        if missing:
+            for role in self.session.scalars(
+                pg_insert(models.Role)
+                .values([{"name": name} for name in missing])
+                .on_conflict_do_nothing(index_elements=["name"])
+                .returning(models.Role)
+            ):
+                roles[role.name] = role
+            # Roles inserted concurrently by another request come back empty
+            # from ON CONFLICT DO NOTHING; read those from the table instead.
+            raced = [name for name in missing if name not in roles]
+            if raced:
+                for role in self.session.scalars(
+                    select(models.Role).where(models.Role.name.in_(raced))
+                ):
+                    roles[role.name] = role
+        return [roles[name] for name in names]
+
     def list_projects(self) -> List[schemas.Project]:
+        cache_key = ("projects", _LIST_CACHE.version(None))
+        cached = _LIST_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
         projects = self.session.scalars(select(models.Project)).all()
-        return [self._to_project(project) for project in projects]
+        result = self._detach(projects, self._to_project)
+        _LIST_CACHE.put(cache_key, result)
+        return result
+
+    def list_project_ids(self) -> List[int]:
+        cache_key = ("project_ids", _LIST_CACHE.version(None))
+        cached = _LIST_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        result = list(self.session.scalars(select(models.Project.id)))
+        _LIST_CACHE.put(cache_key, result)
+        return result
 
     def get_project(self, project_id: int) -> schemas.Project:
         project = self.session.get(models.Project, project_id)
         if not project:
             raise KeyError("project_not_found")
+        self._validated_projects.add(project_id)
         return self._to_project(project)
 
     def create_project(self, payload: schemas.ProjectCreate) -> schemas.Project:
-        project = models.Project(
-            name=payload.name,
-            description=payload.description,
-            status="active",
+        # The project row and its default dataset and vector index are written
+        # by one statement; the child rows read the new id from the CTE.
+        inserted = (
+            insert(models.Project)
+            .values(name=payload.name, description=payload.description, status="active")
+            .returning(*models.Project.__table__.columns)
+            .cte("inserted")
+        )
+        prefix = literal("project_") + cast(inserted.c.id, String)
+        dataset = (
+            insert(models.ProjectDataset)
+            .from_select(
+                ["project_id", "name", "kind", "storage_uri", "is_active"],
+                select(
+                    inserted.c.id,
+                    prefix + literal("_dataset"),
+                    literal("atoms"),
+                    literal("s3://datasets/") + prefix,
+                    literal(True),
+                ),
+            )
+            .returning(models.ProjectDataset.id)
+            .cte("dataset")
+        )
+        vector_index = (
+            insert(models.ProjectVectorIndex)
+            .from_select(
+                ["project_id", "name", "provider", "embedding_dimension", "metadata"],
+                select(
+                    inserted.c.id,
+                    prefix + literal("_atoms"),
+                    literal("pgvector"),
+                    literal(1536),
+                    cast(literal({"table": "atoms"}, JSONB), JSONB),
+                ),
+            )
+            .returning(models.ProjectVectorIndex.id)
+            .cte("vector_index")
         )
-        self.session.add(project)
-        self.session.flush()
-        dataset = models.ProjectDataset(
-            project=project,
-            name=f"project_{project.id}_dataset",
-            kind="atoms",
-            storage_uri=f"s3://datasets/project_{project.id}",
-            is_active=True,
-        )
-        vector_index = models.ProjectVectorIndex(
-            project=project,
-            name=f"project_{project.id}_atoms",
-            provider="pgvector",
-            embedding_dimension=1536,
-            metadata={"table": "atoms"},
-        )
-        self.session.add_all([dataset, vector_index])
+        project = self.session.scalar(
+            select(aliased(models.Project, inserted)).add_cte(dataset, vector_index)
+        )
+        _LIST_CACHE.bump(None)
         return self._to_project(project)
 
     def create_brand_config(
         self, project_id: int, payload: schemas.BrandConfigCreate
     ) -> schemas.BrandConfig:
-        project = self._require_project(project_id)
-        latest = (
-            self.session.scalar(
-                select(models.BrandConfig)
-                .where(models.BrandConfig.project_id == project_id)
-                .order_by(models.BrandConfig.version.desc())
-            )
-            or None
+        self._require_project(project_id)
+        self._lock_versions(project_id)
+        latest = self.session.scalar(
+            _SELECT_LATEST_BRAND_CONFIG, {"project_id": project_id}
         )
-        next_version = latest.version + 1 if latest else 1
-        for active_config in self.session.scalars(
-            select(models.BrandConfig).where(
-                models.BrandConfig.project_id == project_id,
-                models.BrandConfig.is_active.is_(True),
+        self._deactivate(
+            models.BrandConfig,
+            models.BrandConfig.project_id == project_id,
+        )
+        config = self._insert_brand_config(
+            pg_insert(models.BrandConfig)
+            .values(
+                project_id=project_id,
+                version=self._next_version(
+                    models.BrandConfig.version,
+                    models.BrandConfig.project_id == project_id,
+                ),
+                is_active=True,
+                is_stable=payload.is_stable,
+                tone=payload.tone,
+                audience=payload.audience,
+                offers=payload.offers,
+                rubrics=payload.rubrics,
+                forbidden=payload.forbidden,
+                cta_policy=payload.cta_policy,
             )
-        ):
-            active_config.is_active = False
-        config = models.BrandConfig(
-            project=project,
-            version=next_version,
-            is_active=True,
-            is_stable=payload.is_stable,
-            tone=payload.tone,
-            audience=payload.audience,
-            offers=payload.offers,
-            rubrics=payload.rubrics,
-            forbidden=payload.forbidden,
-            cta_policy=payload.cta_policy,
-        )
-        self.session.add(config)
-        self.session.flush()
-        self._record_brand_config_history(
-            project_id=project_id,
-            config=config,
+            .on_conflict_do_nothing(),
             previous=latest,
             change_summary=payload.change_summary,
         )
@@ -144,7 +603,7 @@ class DatabaseStore:
         configs = self.session.scalars(
             select(models.BrandConfig).where(models.BrandConfig.project_id == project_id)
         ).all()
-        return [self._to_brand_config(config) for config in configs]
+        return self._detach(configs, self._to_brand_config)
 
     def list_brand_config_history(self, project_id: int) -> List[schemas.BrandConfigHistory]:
         self._require_project(project_id)
@@ -153,18 +612,16 @@ class DatabaseStore:
             .where(models.BrandConfigHistory.project_id == project_id)
             .order_by(models.BrandConfigHistory.created_at.desc())
         ).all()
-        return [self._to_brand_config_history(entry) for entry in history]
+        return self._detach(history, self._to_brand_config_history)
 
     def set_brand_config_stable(
         self, project_id: int, config_id: int, payload: schemas.StableVersionUpdate
     ) -> schemas.BrandConfig:
-        config = self.session.get(models.BrandConfig, config_id)
-        if not config or config.project_id != project_id:
-            raise KeyError("brand_config_not_found")
+        config = self._get_owned(
+            models.BrandConfig, config_id, project_id, "brand_config_not_found"
+        )
         previous = self._brand_config_snapshot(config)
         config.is_stable = payload.is_stable
-        self.session.add(config)
-        self.session.flush()
         self.session.add(
             models.BrandConfigHistory(
                 project_id=project_id,
@@ -177,12 +634,14 @@ class DatabaseStore:
                 },
             )
         )
+        self._flush()
         return self._to_brand_config(config)
 
     def rollback_brand_config(
         self, project_id: int, payload: schemas.BrandConfigRollback
     ) -> schemas.BrandConfig:
         self._require_project(project_id)
+        self._lock_versions(project_id)
         target = self.session.scalar(
             select(models.BrandConfig).where(
                 models.BrandConfig.project_id == project_id,
@@ -194,35 +653,30 @@ class DatabaseStore:
         if not target.is_stable:
             raise ValueError("brand_config_not_stable")
         latest = self.session.scalar(
-            select(models.BrandConfig)
-            .where(models.BrandConfig.project_id == project_id)
-            .order_by(models.BrandConfig.version.desc())
+            _SELECT_LATEST_BRAND_CONFIG, {"project_id": project_id}
         )
-        next_version = latest.version + 1 if latest else 1
-        for active_config in self.session.scalars(
-            select(models.BrandConfig).where(
-                models.BrandConfig.project_id == project_id,
-                models.BrandConfig.is_active.is_(True),
+        self._deactivate(
+            models.BrandConfig,
+            models.BrandConfig.project_id == project_id,
+        )
+        config = self._insert_brand_config(
+            pg_insert(models.BrandConfig)
+            .values(
+                project_id=project_id,
+                version=self._next_version(
+                    models.BrandConfig.version,
+                    models.BrandConfig.project_id == project_id,
+                ),
+                is_active=True,
+                is_stable=False,
+                tone=target.tone,
+                audience=target.audience,
+                offers=target.offers,
+                rubrics=target.rubrics,
+                forbidden=target.forbidden,
+                cta_policy=target.cta_policy,
             )
-        ):
-            active_config.is_active = False
-        config = models.BrandConfig(
-            project_id=project_id,
-            version=next_version,
-            is_active=True,
-            is_stable=False,
-            tone=target.tone,
-            audience=target.audience,
-            offers=target.offers,
-            rubrics=target.rubrics,
-            forbidden=target.forbidden,
-            cta_policy=target.cta_policy,
-        )
-        self.session.add(config)
-        self.session.flush()
-        self._record_brand_config_history(
-            project_id=project_id,
-            config=config,
+            .on_conflict_do_nothing(),
             previous=latest,
             change_summary=payload.change_summary
             or f"rollback_to_version_{target.version}",
@@ -230,18 +684,19 @@ class DatabaseStore:
         return self._to_brand_config(config)
 
     def create_budget(self, project_id: int, payload: schemas.BudgetCreate) -> schemas.Budget:
-        project = self._require_project(project_id)
-        budget = models.Budget(
-            project=project,
-            daily=payload.daily,
-            weekly=payload.weekly,
-            monthly=payload.monthly,
-            token_limit=payload.token_limit,
-            video_seconds_limit=payload.video_seconds_limit,
-            publication_limit=payload.publication_limit,
-        )
-        self.session.add(budget)
-        self.session.flush()
+        self._require_project(project_id)
+        budget = self.session.scalar(
+            _INSERT_BUDGET,
+            {
+                "project_id": project_id,
+                "daily": payload.daily,
+                "weekly": payload.weekly,
+                "monthly": payload.monthly,
+                "token_limit": payload.token_limit,
+                "video_seconds_limit": payload.video_seconds_limit,
+                "publication_limit": payload.publication_limit,
+            },
+        )
         return self._to_budget(budget)
 
     def list_budgets(self, project_id: int) -> List[schemas.Budget]:
@@ -249,15 +704,11 @@ class DatabaseStore:
         budgets = self.session.scalars(
             select(models.Budget).where(models.Budget.project_id == project_id)
         ).all()
-        return [self._to_budget(budget) for budget in budgets]
+        return self._detach(budgets, self._to_budget)
 
     def get_latest_budget(self, project_id: int) -> Optional[schemas.Budget]:
         self._require_project(project_id)
-        budget = self.session.scalar(
-            select(models.Budget)
-            .where(models.Budget.project_id == project_id)
-            .order_by(models.Budget.created_at.desc())
-        )
+        budget = self.session.scalar(_SELECT_LATEST_BUDGET, {"project_id": project_id})
         if not budget:
             return None
         return self._to_budget(budget)
@@ -265,28 +716,38 @@ class DatabaseStore:
     def create_budget_usage(
         self, project_id: int, payload: schemas.BudgetUsageCreate
     ) -> schemas.BudgetUsage:
-        project = self._require_project(project_id)
-        budget = self.session.get(models.Budget, payload.budget_id)
-        if not budget or budget.project_id != project_id:
-            raise KeyError("budget_not_found")
-        usage = models.BudgetUsage(
-            budget=budget,
-            project=project,
-            usage_date=payload.usage_date,
-            token_used=payload.token_used,
-            video_seconds_used=payload.video_seconds_used,
-            publications_used=payload.publications_used,
-        )
-        self.session.add(usage)
-        self.session.flush()
+        self._require_owned(
+            models.Budget, payload.budget_id, project_id, "budget_not_found"
+        )
+        usage = self.session.scalar(
+            _INSERT_BUDGET_USAGE,
+            {
+                "budget_id": payload.budget_id,
+                "project_id": project_id,
+                "usage_date": payload.usage_date,
+                "token_used": payload.token_used,
+                "video_seconds_used": payload.video_seconds_used,
+                "publications_used": payload.publications_used,
+            },
+        )
         return self._to_budget_usage(usage)
 
-    def list_budget_usages(self, project_id: int) -> List[schemas.BudgetUsage]:
+    def list_budget_usages(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.BudgetUsage]:
         self._require_project(project_id)
         usages = self.session.scalars(
-            select(models.BudgetUsage).where(models.BudgetUsage.project_id == project_id)
+            self._paginate(
+                select(models.BudgetUsage).where(models.BudgetUsage.project_id == project_id),
+                models.BudgetUsage,
+                after_id,
+                limit,
+            )
         ).all()
-        return [self._to_budget_usage(usage) for usage in usages]
+        return self._detach(usages, self._to_budget_usage)
 
     def sum_budget_usage(
         self, project_id: int, start: datetime, end: datetime
@@ -294,108 +755,182 @@ class DatabaseStore:
         self._require_project(project_id)
         totals = self.session.execute(
             select(
-                func.coalesce(func.sum(models.BudgetUsage.token_used), 0),
-                func.coalesce(func.sum(models.BudgetUsage.video_seconds_used), 0),
-                func.coalesce(func.sum(models.BudgetUsage.publications_used), 0),
+                func.coalesce(func.sum(models.BudgetUsage.token_used), 0).label(
+                    "token_used"
+                ),
+                func.coalesce(
+                    func.sum(models.BudgetUsage.video_seconds_used), 0
+                ).label("video_seconds_used"),
+                func.coalesce(
+                    func.sum(models.BudgetUsage.publications_used), 0
+                ).label("publications_used"),
             ).where(
                 models.BudgetUsage.project_id == project_id,
                 models.BudgetUsage.usage_date >= start,
                 models.BudgetUsage.usage_date <= end,
             )
         ).one()
-        return BudgetUsageTotals(
-            token_used=int(totals[0] or 0),
-            video_seconds_used=int(totals[1] or 0),
-            publications_used=int(totals[2] or 0),
-        )
+        return BudgetUsageTotals(**totals._asdict())
 
     def create_source(self, project_id: int, payload: schemas.SourceCreate) -> schemas.Source:
-        project = self._require_project(project_id)
-        source = models.Source(
-            project=project,
-            title=payload.title,
-            source_type=payload.source_type,
-            uri=payload.uri,
-            content=payload.content,
-            artifact_uri=payload.artifact_uri,
-            artifact_version=payload.artifact_version,
-            artifact_metadata=payload.artifact_metadata,
-            status=payload.status,
-            is_current=payload.is_current,
-        )
-        self.session.add(source)
-        self.session.flush()
+        self._require_project(project_id)
+        # Column RETURNING: an ORM entity would leave the deferred content
+        # unloaded and _to_source would fetch it back.
+        source = self.session.execute(
+            _INSERT_SOURCE,
+            {
+                "project_id": project_id,
+                "title": payload.title,
+                "source_type": payload.source_type,
+                "uri": payload.uri,
+                "content": payload.content,
+                "artifact_uri": payload.artifact_uri,
+                "artifact_version": payload.artifact_version,
+                "artifact_metadata": payload.artifact_metadata,
+                "status": payload.status,
+                "is_current": payload.is_current,
+            },
+        ).one()
+        _LIST_CACHE.bump(project_id)
         return self._to_source(source)
 
-    def list_sources(self, project_id: int) -> List[schemas.Source]:
+    def list_sources(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.Source]:
+        # Validate first so a cached listing never answers for a project id
+        # the database does not have.
         self._require_project(project_id)
-        sources = self.session.scalars(
-            select(models.Source).where(models.Source.project_id == project_id)
-        ).all()
-        return [self._to_source(source) for source in sources]
+        paginated = after_id is not None or limit is not None
+        cache_key = ("sources", project_id, _LIST_CACHE.version(project_id))
+        if not paginated:
+            cached = _LIST_CACHE.get(cache_key)
+            if cached is not None:
+                return list(cached)
+        # Listings leave out the content blob; get_source returns it.
+        result = self._fetch_all(
+            self._paginate(
+                select(*_SOURCE_LIST_COLUMNS).where(
+                    models.Source.project_id == project_id
+                ),
+                models.Source,
+                after_id,
+                limit,
+            ),
+            schemas.Source,
+        )
+        if not paginated:
+            _LIST_CACHE.put(cache_key, result)
+        return result
+
+    def get_source(self, project_id: int, source_id: int) -> schemas.Source:
+        source = self._get_owned(
+            models.Source,
+            source_id,
+            project_id,
+            "source_not_found",
+            undefer(models.Source.content),
+        )
+        return self._to_source(source)
 
     def update_source(
         self, project_id: int, source_id: int, payload: schemas.SourceUpdate
     ) -> schemas.Source:
-        source = self.session.get(models.Source, source_id)
-        if not source or source.project_id != project_id:
-            raise KeyError("source_not_found")
+        source = self._get_owned(
+            models.Source,
+            source_id,
+            project_id,
+            "source_not_found",
+            undefer(models.Source.content),
+        )
         updates = payload.model_dump(exclude_unset=True)
         for field_name, value in updates.items():
             setattr(source, field_name, value)
-        self.session.add(source)
-        self.session.flush()
+        self._flush()
+        _LIST_CACHE.bump(project_id)
         return self._to_source(source)
 
     def create_atom(self, project_id: int, payload: schemas.AtomCreate) -> schemas.Atom:
-        project = self._require_project(project_id)
-        source = self.session.get(models.Source, payload.source_id)
-        if not source or source.project_id != project_id:
-            raise KeyError("source_not_found")
-        atom = models.Atom(
-            project=project,
-            source=source,
-            kind=payload.kind,
-            text=payload.text,
-            source_backed=payload.source_backed,
-            embedding=payload.embedding,
-            source_uri=payload.source_uri,
-            source_version=payload.source_version,
-            artifact_uri=payload.artifact_uri,
-            artifact_version=payload.artifact_version,
-            artifact_metadata=payload.artifact_metadata,
-            status=payload.status,
-            is_current=payload.is_current,
-        )
-        self.session.add(atom)
-        self.session.flush()
+        self._require_owned(
+            models.Source, payload.source_id, project_id, "source_not_found"
+        )
+        atom = self.session.scalar(
+            _INSERT_ATOM,
+            {
+                "project_id": project_id,
+                "source_id": payload.source_id,
+                "kind": payload.kind,
+                "text": payload.text,
+                "source_backed": payload.source_backed,
+                "embedding": payload.embedding,
+                "source_uri": payload.source_uri,
+                "source_version": payload.source_version,
+                "artifact_uri": payload.artifact_uri,
+                "artifact_version": payload.artifact_version,
+                "artifact_metadata": payload.artifact_metadata,
+                "status": payload.status,
+                "is_current": payload.is_current,
+            },
+        )
         return self._to_atom(atom)
 
-    def list_atoms(self, project_id: int) -> List[schemas.Atom]:
+    def list_atoms(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.Atom]:
+        return self._fetch_all(
+            self._select_atoms(project_id, after_id, limit), schemas.Atom
+        )
+
+    def iter_atoms(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[schemas.Atom]:
+        return self._stream(
+            self._select_atoms(project_id, after_id, limit), schemas.Atom
+        )
+
+    def _select_atoms(
+        self, project_id: int, after_id: Optional[int], limit: Optional[int]
+    ) -> Select:
         self._require_project(project_id)
-        atoms = self.session.scalars(
-            select(models.Atom).where(models.Atom.project_id == project_id)
-        ).all()
-        return [self._to_atom(atom) for atom in atoms]
+        return self._paginate(
+            select(*_ATOM_COLUMNS).where(models.Atom.project_id == project_id),
+            models.Atom,
+            after_id,
+            limit,
+        )
+
+    def list_atoms_raw(self, project_id: int) -> List[AtomDTO]:
+        self._require_project(project_id)
+        rows = self.session.execute(
+            select(*_ATOM_DTO_COLUMNS).where(models.Atom.project_id == project_id)
+        )
+        return [AtomDTO(*row) for row in rows]
 
     def get_topic(self, project_id: int, topic_id: int) -> schemas.Topic:
-        topic = self.session.get(models.Topic, topic_id)
-        if not topic or topic.project_id != project_id:
-            raise KeyError("topic_not_found")
+        topic = self._get_owned(models.Topic, topic_id, project_id, "topic_not_found")
         return self._to_topic(topic)
 
     def create_topic(self, project_id: int, payload: schemas.TopicCreate) -> schemas.Topic:
-        project = self._require_project(project_id)
-        topic = models.Topic(
-            project=project,
-            title=payload.title,
-            angle=payload.angle,
-            rubric=payload.rubric,
-            planned_for=payload.planned_for,
-            status="planned",
-        )
-        self.session.add(topic)
-        self.session.flush()
+        self._require_project(project_id)
+        topic = self.session.scalar(
+            _INSERT_TOPIC,
+            {
+                "project_id": project_id,
+                "title": payload.title,
+                "angle": payload.angle,
+                "rubric": payload.rubric,
+                "planned_for": payload.planned_for,
+                "status": "planned",
+            },
+        )
         return self._to_topic(topic)
 
     def list_topics(self, project_id: int) -> List[schemas.Topic]:
@@ -403,23 +938,21 @@ class DatabaseStore:
         topics = self.session.scalars(
             select(models.Topic).where(models.Topic.project_id == project_id)
         ).all()
-        return [self._to_topic(topic) for topic in topics]
+        return self._detach(topics, self._to_topic)
 
     def create_content_pack(
         self, project_id: int, payload: schemas.ContentPackCreate
     ) -> schemas.ContentPack:
-        project = self._require_project(project_id)
-        topic = self.session.get(models.Topic, payload.topic_id)
-        if not topic or topic.project_id != project_id:
-            raise KeyError("topic_not_found")
-        pack = models.ContentPack(
-            project=project,
-            topic=topic,
-            description=payload.description,
-            status="queued",
+        self._require_owned(models.Topic, payload.topic_id, project_id, "topic_not_found")
+        pack = self.session.scalar(
+            _INSERT_CONTENT_PACK,
+            {
+                "project_id": project_id,
+                "topic_id": payload.topic_id,
+                "description": payload.description,
+                "status": "queued",
+            },
         )
-        self.session.add(pack)
-        self.session.flush()
         return self._to_content_pack(pack)
 
     def list_content_packs(self, project_id: int) -> List[schemas.ContentPack]:
@@ -427,94 +960,150 @@ class DatabaseStore:
         packs = self.session.scalars(
             select(models.ContentPack).where(models.ContentPack.project_id == project_id)
         ).all()
-        return [self._to_content_pack(pack) for pack in packs]
+        return self._detach(packs, self._to_content_pack)
 
     def create_content_item(
         self, project_id: int, payload: schemas.ContentItemCreate
     ) -> schemas.ContentItem:
-        project = self._require_project(project_id)
-        pack = self.session.get(models.ContentPack, payload.pack_id)
-        if not pack or pack.project_id != project_id:
-            raise KeyError("content_pack_not_found")
-        item = models.ContentItem(
-            project=project,
-            content_pack=pack,
-            channel=payload.channel,
-            format=payload.format,
-            body=payload.body,
-            metadata=payload.metadata,
-            status="draft",
-        )
-        self.session.add(item)
-        self.session.flush()
+        self._require_owned(
+            models.ContentPack, payload.pack_id, project_id, "content_pack_not_found"
+        )
+        item = self.session.scalar(
+            _INSERT_CONTENT_ITEM,
+            {
+                "project_id": project_id,
+                "pack_id": payload.pack_id,
+                "channel": payload.channel,
+                "format": payload.format,
+                "body": payload.body,
+                "metadata": payload.metadata,
+                "status": "draft",
+            },
+        )
         return self._to_content_item(item)
 
-    def list_content_items(self, project_id: int) -> List[schemas.ContentItem]:
+    def list_content_items(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.ContentItem]:
         self._require_project(project_id)
         items = self.session.scalars(
-            select(models.ContentItem).where(models.ContentItem.project_id == project_id)
+            self._paginate(
+                select(models.ContentItem).where(models.ContentItem.project_id == project_id),
+                models.ContentItem,
+                after_id,
+                limit,
+            )
         ).all()
-        return [self._to_content_item(item) for item in items]
+        return self._detach(items, self._to_content_item)
+
+    def list_content_items_expanded(
+        self, project_id: int
+    ) -> List[schemas.ContentItemExpanded]:
+        self._require_project(project_id)
+        items = self.session.scalars(
+            select(models.ContentItem)
+            .where(models.ContentItem.project_id == project_id)
+            .options(
+                selectinload(models.ContentItem.qc_reports),
+                selectinload(models.ContentItem.publications),
+                selectinload(models.ContentItem.metric_snapshots),
+            )
+        ).all()
+        return self._detach(items, self._to_content_item_expanded)
 
     def get_content_item(
         self, project_id: int, content_item_id: int
     ) -> schemas.ContentItem:
-        item = self.session.get(models.ContentItem, content_item_id)
-        if not item or item.project_id != project_id:
-            raise KeyError("content_item_not_found")
+        item = self._get_owned(
+            models.ContentItem, content_item_id, project_id, "content_item_not_found"
+        )
         return self._to_content_item(item)
 
     def get_content_item_with_topic(
         self, project_id: int, content_item_id: int
     ) -> tuple[schemas.ContentItem, schemas.Topic]:
-        item = self.session.get(models.ContentItem, content_item_id)
-        if not item or item.project_id != project_id:
+        row = self.session.execute(
+            select(models.ContentItem, models.Topic)
+            .outerjoin(
+                models.ContentPack, models.ContentItem.pack_id == models.ContentPack.id
+            )
+            .outerjoin(models.Topic, models.ContentPack.topic_id == models.Topic.id)
+            .where(
+                models.ContentItem.id == content_item_id,
+                models.ContentItem.project_id == project_id,
+            )
+        ).one_or_none()
+        if row is None:
             raise KeyError("content_item_not_found")
-        topic = item.content_pack.topic if item.content_pack else None
-        if not topic:
+        item, topic = row
+        if topic is None:
             raise KeyError("topic_not_found")
         return self._to_content_item(item), self._to_topic(topic)
 
     def update_content_item_metadata(
         self, project_id: int, content_item_id: int, metadata_update: dict
     ) -> schemas.ContentItem:
-        item = self.session.get(models.ContentItem, content_item_id)
-        if not item or item.project_id != project_id:
-            raise KeyError("content_item_not_found")
-        metadata = dict(item.metadata or {})
-        metadata.update(metadata_update)
-        item.metadata = metadata
-        self.session.add(item)
-        self.session.flush()
+        item = self._get_owned(
+            models.ContentItem, content_item_id, project_id, "content_item_not_found"
+        )
+        existing = item.metadata or {}
+        changes = {
+            key: value
+            for key, value in metadata_update.items()
+            if key not in existing or existing[key] != value
+        }
+        if changes:
+            item.metadata = {**existing, **changes}
+            self._flush()
         return self._to_content_item(item)
 
     def update_content_item_status(
         self, project_id: int, content_item_id: int, status: str
     ) -> schemas.ContentItem:
-        item = self.session.get(models.ContentItem, content_item_id)
-        if not item or item.project_id != project_id:
-            raise KeyError("content_item_not_found")
+        item = self._get_owned(
+            models.ContentItem, content_item_id, project_id, "content_item_not_found"
+        )
         item.status = status
-        self.session.add(item)
-        self.session.flush()
+        self._flush()
         return self._to_content_item(item)
 
+    def bulk_update_content_item_status(
+        self, project_id: int, content_item_ids: List[int], status: str
+    ) -> int:
+        if not content_item_ids:
+            return 0
+        result = self.session.execute(
+            update(models.ContentItem)
+            .where(
+                models.ContentItem.project_id == project_id,
+                models.ContentItem.id.in_(content_item_ids),
+            )
+            .values(status=status)
+        )
+        return result.rowcount
+
     def create_qc_report(
         self, project_id: int, payload: schemas.QcReportCreate
     ) -> schemas.QcReport:
-        project = self._require_project(project_id)
-        item = self.session.get(models.ContentItem, payload.content_item_id)
-        if not item or item.project_id != project_id:
-            raise KeyError("content_item_not_found")
-        report = models.QcReport(
-            project=project,
-            content_item=item,
-            score=payload.score,
-            passed=payload.passed,
-            reasons=payload.reasons,
-        )
-        self.session.add(report)
-        self.session.flush()
+        self._require_owned(
+            models.ContentItem,
+            payload.content_item_id,
+            project_id,
+            "content_item_not_found",
+        )
+        report = self.session.scalar(
+            _INSERT_QC_REPORT,
+            {
+                "project_id": project_id,
+                "content_item_id": payload.content_item_id,
+                "score": payload.score,
+                "passed": payload.passed,
+                "reasons": payload.reasons,
+            },
+        )
         return self._to_qc_report(report)
 
     def list_qc_reports(self, project_id: int) -> List[schemas.QcReport]:
@@ -522,33 +1111,53 @@ class DatabaseStore:
         reports = self.session.scalars(
             select(models.QcReport).where(models.QcReport.project_id == project_id)
         ).all()
-        return [self._to_qc_report(report) for report in reports]
+        return self._detach(reports, self._to_qc_report)
 
     def create_publication(
         self, project_id: int, payload: schemas.PublicationCreate
     ) -> schemas.Publication:
-        project = self._require_project(project_id)
-        item = self.session.get(models.ContentItem, payload.content_item_id)
-        if not item or item.project_id != project_id:
-            raise KeyError("content_item_not_found")
-        publication = models.Publication(
-            project=project,
-            content_item=item,
-            platform=payload.platform,
-            scheduled_at=payload.scheduled_at,
-            status=payload.status,
-            idempotency_key=payload.idempotency_key,
-        )
-        self.session.add(publication)
-        self.session.flush()
+        self._require_owned(
+            models.ContentItem,
+            payload.content_item_id,
+            project_id,
+            "content_item_not_found",
+        )
+        publication = self.session.scalar(
+            _INSERT_PUBLICATION,
+            {
+                "project_id": project_id,
+                "content_item_id": payload.content_item_id,
+                "platform": payload.platform,
+                "scheduled_at": payload.scheduled_at,
+                "status": payload.status,
+                "idempotency_key": payload.idempotency_key,
+            },
+        )
+        if publication is None:
+            existing = self.get_publication_by_idempotency_key(
+                project_id, payload.idempotency_key
+            )
+            if existing is None:
+                raise ValueError("publication_conflict")
+            return existing
         return self._to_publication(publication)
 
-    def list_publications(self, project_id: int) -> List[schemas.Publication]:
+    def list_publications(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.Publication]:
         self._require_project(project_id)
         publications = self.session.scalars(
-            select(models.Publication).where(models.Publication.project_id == project_id)
+            self._paginate(
+                select(models.Publication).where(models.Publication.project_id == project_id),
+                models.Publication,
+                after_id,
+                limit,
+            )
         ).all()
-        return [self._to_publication(publication) for publication in publications]
+        return self._detach(publications, self._to_publication)
 
     def get_publication_by_idempotency_key(
         self, project_id: int, idempotency_key: str
@@ -569,79 +1178,160 @@ class DatabaseStore:
     ) -> List[schemas.Publication]:
         self._require_project(project_id)
         publications = self.session.scalars(
-            select(models.Publication).where(
-                models.Publication.project_id == project_id,
-                models.Publication.status == "scheduled",
-                models.Publication.scheduled_at <= scheduled_before,
-            )
+            _SELECT_DUE_PUBLICATIONS,
+            {"project_id": project_id, "scheduled_before": scheduled_before},
+        ).all()
+        return self._detach(publications, self._to_publication)
+
+    def claim_due_publications(
+        self, scheduled_before: datetime, limit: int, shard: int = 0, shards: int = 1
+    ) -> List[schemas.Publication]:
+        # SKIP LOCKED keeps concurrent schedulers off each other's rows, and
+        # the claimed rows leave "scheduled" when the caller commits; if the
+        # caller rolls back (e.g. the enqueue failed) they are due again.
+        # Only projects with project_id % shards == shard are claimed.
+        publications = self.session.scalars(
+            _CLAIM_DUE_PUBLICATIONS,
+            {
+                "scheduled_before": scheduled_before,
+                "limit": limit,
+                "shard": shard,
+                "shards": shards,
+            },
         ).all()
-        return [self._to_publication(publication) for publication in publications]
+        return self._detach(publications, self._to_publication)
+
+    def claim_due_publications_by_id(
+        self, publication_ids: Sequence[int], scheduled_before: datetime
+    ) -> List[schemas.Publication]:
+        # Same claim as claim_due_publications, restricted to the given ids;
+        # ids that are not due, not scheduled or locked are skipped.
+        if not publication_ids:
+            return []
+        publications = self.session.scalars(
+            _CLAIM_DUE_PUBLICATIONS_BY_ID,
+            {
+                "publication_ids": list(publication_ids),
+                "scheduled_before": scheduled_before,
+            },
+        ).all()
+        return self._detach(publications, self._to_publication)
 
     def create_metric_snapshot(
         self, project_id: int, payload: schemas.MetricSnapshotCreate
     ) -> schemas.MetricSnapshot:
-        project = self._require_project(project_id)
-        item = self.session.get(models.ContentItem, payload.content_item_id)
-        if not item or item.project_id != project_id:
-            raise KeyError("content_item_not_found")
-        snapshot = models.MetricSnapshot(
-            project=project,
-            content_item=item,
-            impressions=payload.impressions,
-            clicks=payload.clicks,
-            likes=payload.likes,
-            comments=payload.comments,
-            shares=payload.shares,
-        )
-        self.session.add(snapshot)
-        self.session.flush()
+        self._require_owned(
+            models.ContentItem,
+            payload.content_item_id,
+            project_id,
+            "content_item_not_found",
+        )
+        snapshot = self.session.scalar(
+            _INSERT_METRIC_SNAPSHOT,
+            {
+                "project_id": project_id,
+                "content_item_id": payload.content_item_id,
+                "impressions": payload.impressions,
+                "clicks": payload.clicks,
+                "likes": payload.likes,
+                "comments": payload.comments,
+                "shares": payload.shares,
+            },
+        )
         return self._to_metric_snapshot(snapshot)
 
-    def list_metric_snapshots(self, project_id: int) -> List[schemas.MetricSnapshot]:
+    def list_metric_snapshots(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.MetricSnapshot]:
+        return self._fetch_all(
+            self._select_metric_snapshots(project_id, after_id, limit),
+            schemas.MetricSnapshot,
+        )
+
+    def iter_metric_snapshots(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[schemas.MetricSnapshot]:
+        return self._stream(
+            self._select_metric_snapshots(project_id, after_id, limit),
+            schemas.MetricSnapshot,
+        )
+
+    def _select_metric_snapshots(
+        self, project_id: int, after_id: Optional[int], limit: Optional[int]
+    ) -> Select:
         self._require_project(project_id)
-        snapshots = self.session.scalars(
-            select(models.MetricSnapshot).where(
+        return self._paginate(
+            select(*_METRIC_SNAPSHOT_COLUMNS).where(
                 models.MetricSnapshot.project_id == project_id
-            )
-        ).all()
-        return [self._to_metric_snapshot(snapshot) for snapshot in snapshots]
+            ),
+            models.MetricSnapshot,
+            after_id,
+            limit,
+        )
 
     def list_recent_metric_snapshots(
         self, project_id: int, limit: int
-    ) -> List[models.MetricSnapshot]:
+    ) -> List[schemas.MetricSnapshot]:
+        return self._fetch_all(
+            self._select_recent_metric_snapshots(project_id, limit),
+            schemas.MetricSnapshot,
+        )
+
+    def iter_recent_metric_snapshots(
+        self, project_id: int, limit: int
+    ) -> Iterator[schemas.MetricSnapshot]:
+        return self._stream(
+            self._select_recent_metric_snapshots(project_id, limit),
+            schemas.MetricSnapshot,
+        )
+
+    def _select_recent_metric_snapshots(self, project_id: int, limit: int) -> Select:
         self._require_project(project_id)
         return (
-            self.session.scalars(
-                select(models.MetricSnapshot)
-                .where(models.MetricSnapshot.project_id == project_id)
-                .order_by(desc(models.MetricSnapshot.collected_at))
-                .limit(limit)
-            )
-            .unique()
-            .all()
+            select(*_METRIC_SNAPSHOT_COLUMNS)
+            .where(models.MetricSnapshot.project_id == project_id)
+            .order_by(desc(models.MetricSnapshot.collected_at))
+            .limit(limit)
         )
 
     def create_learning_event(
         self, project_id: int, payload: schemas.LearningEventCreate
     ) -> schemas.LearningEvent:
-        project = self._require_project(project_id)
-        event = models.LearningEvent(
-            project=project,
-            parameter=payload.parameter,
-            previous_value=payload.previous_value,
-            new_value=payload.new_value,
-            reason=payload.reason,
-        )
-        self.session.add(event)
-        self.session.flush()
+        self._require_project(project_id)
+        event = self.session.scalar(
+            _INSERT_LEARNING_EVENT,
+            {
+                "project_id": project_id,
+                "parameter": payload.parameter,
+                "previous_value": payload.previous_value,
+                "new_value": payload.new_value,
+                "reason": payload.reason,
+            },
+        )
         return self._to_learning_event(event)
 
-    def list_learning_events(self, project_id: int) -> List[schemas.LearningEvent]:
+    def list_learning_events(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.LearningEvent]:
         self._require_project(project_id)
         events = self.session.scalars(
-            select(models.LearningEvent).where(models.LearningEvent.project_id == project_id)
+            self._paginate(
+                select(models.LearningEvent).where(models.LearningEvent.project_id == project_id),
+                models.LearningEvent,
+                after_id,
+                limit,
+            )
         ).all()
-        return [self._to_learning_event(event) for event in events]
+        return self._detach(events, self._to_learning_event)
 
     def get_or_create_auto_learning_config(
         self, project_id: int
@@ -654,34 +1344,42 @@ class DatabaseStore:
         )
         if config:
             return self._to_auto_learning_config(config)
-        config = models.AutoLearningConfig(
-            project_id=project_id,
-            max_changes_per_week=2,
-            rollback_threshold=0.02,
-            rollback_window=20,
-            protected_parameters=[],
-        )
-        self.session.add(config)
-        self.session.flush()
+        # A concurrent first run may insert the row first; read it back then.
+        config = self.session.scalar(
+            pg_insert(models.AutoLearningConfig)
+            .values(
+                project_id=project_id,
+                max_changes_per_week=2,
+                rollback_threshold=0.02,
+                rollback_window=20,
+                protected_parameters=[],
+            )
+            .on_conflict_do_nothing(index_elements=["project_id"])
+            .returning(models.AutoLearningConfig)
+        ) or self.session.scalar(
+            select(models.AutoLearningConfig).where(
+                models.AutoLearningConfig.project_id == project_id
+            )
+        )
         return self._to_auto_learning_config(config)
 
     def upsert_auto_learning_config(
         self, project_id: int, payload: schemas.AutoLearningConfigCreate
     ) -> schemas.AutoLearningConfig:
         self._require_project(project_id)
+        values = {
+            "max_changes_per_week": payload.max_changes_per_week,
+            "rollback_threshold": payload.rollback_threshold,
+            "rollback_window": payload.rollback_window,
+            "protected_parameters": payload.protected_parameters,
+        }
         config = self.session.scalar(
-            select(models.AutoLearningConfig).where(
-                models.AutoLearningConfig.project_id == project_id
-            )
+            pg_insert(models.AutoLearningConfig)
+            .values(project_id=project_id, **values)
+            .on_conflict_do_update(index_elements=["project_id"], set_=values)
+            .returning(models.AutoLearningConfig)
+            .execution_options(populate_existing=True)
         )
-        if not config:
-            config = models.AutoLearningConfig(project_id=project_id)
-        config.max_changes_per_week = payload.max_changes_per_week
-        config.rollback_threshold = payload.rollback_threshold
-        config.rollback_window = payload.rollback_window
-        config.protected_parameters = payload.protected_parameters
-        self.session.add(config)
-        self.session.flush()
         return self._to_auto_learning_config(config)
 
     def get_or_create_auto_learning_state(
@@ -695,76 +1393,75 @@ class DatabaseStore:
         )
         if state:
             return self._to_auto_learning_state(state)
-        state = models.AutoLearningState(
-            project_id=project_id,
-            parameters={},
-            stable_parameters={},
-            window_started_at=None,
-            changes_in_window=0,
-        )
-        self.session.add(state)
-        self.session.flush()
+        state = self.session.scalar(
+            pg_insert(models.AutoLearningState)
+            .values(
+                project_id=project_id,
+                parameters={},
+                stable_parameters={},
+                window_started_at=None,
+                changes_in_window=0,
+            )
+            .on_conflict_do_nothing(index_elements=["project_id"])
+            .returning(models.AutoLearningState)
+        ) or self.session.scalar(
+            select(models.AutoLearningState).where(
+                models.AutoLearningState.project_id == project_id
+            )
+        )
         return self._to_auto_learning_state(state)
 
     def update_auto_learning_state(
         self, project_id: int, payload: schemas.AutoLearningState
     ) -> schemas.AutoLearningState:
         self._require_project(project_id)
+        values = {
+            "parameters": payload.parameters,
+            "stable_parameters": payload.stable_parameters,
+            "window_started_at": payload.window_started_at,
+            "changes_in_window": payload.changes_in_window,
+            "last_change_at": payload.last_change_at,
+            "last_rollback_at": payload.last_rollback_at,
+        }
         state = self.session.scalar(
-            select(models.AutoLearningState).where(
-                models.AutoLearningState.project_id == project_id
-            )
+            pg_insert(models.AutoLearningState)
+            .values(project_id=project_id, **values)
+            .on_conflict_do_update(index_elements=["project_id"], set_=values)
+            .returning(models.AutoLearningState)
+            .execution_options(populate_existing=True)
         )
-        if not state:
-            state = models.AutoLearningState(project_id=project_id)
-        state.parameters = payload.parameters
-        state.stable_parameters = payload.stable_parameters
-        state.window_started_at = payload.window_started_at
-        state.changes_in_window = payload.changes_in_window
-        state.last_change_at = payload.last_change_at
-        state.last_rollback_at = payload.last_rollback_at
-        self.session.add(state)
-        self.session.flush()
         return self._to_auto_learning_state(state)
 
     def create_prompt_version(
         self, project_id: int, payload: schemas.PromptVersionCreate
     ) -> schemas.PromptVersion:
-        project = self._require_project(project_id)
-        latest = (
-            self.session.scalar(
-                select(models.PromptVersion)
-                .where(
-                    models.PromptVersion.project_id == project_id,
-                    models.PromptVersion.prompt_key == payload.prompt_key,
-                )
-                .order_by(models.PromptVersion.version.desc())
-            )
-            or None
-        )
-        next_version = latest.version + 1 if latest else 1
+        self._require_project(project_id)
+        self._lock_versions(project_id)
+        latest = self.session.execute(
+            _SELECT_LATEST_PROMPT_VERSION,
+            {"project_id": project_id, "prompt_key": payload.prompt_key},
+        ).first()
         if payload.is_active:
-            for active_prompt in self.session.scalars(
-                select(models.PromptVersion).where(
+            self._deactivate(
+                models.PromptVersion,
+                models.PromptVersion.project_id == project_id,
+                models.PromptVersion.prompt_key == payload.prompt_key,
+            )
+        prompt = self._insert_prompt_version(
+            pg_insert(models.PromptVersion)
+            .values(
+                project_id=project_id,
+                prompt_key=payload.prompt_key,
+                content=payload.content,
+                version=self._next_version(
+                    models.PromptVersion.version,
                     models.PromptVersion.project_id == project_id,
                     models.PromptVersion.prompt_key == payload.prompt_key,
-                    models.PromptVersion.is_active.is_(True),
-                )
-            ):
-                active_prompt.is_active = False
-        prompt = models.PromptVersion(
-            project=project,
-            prompt_key=payload.prompt_key,
-            content=payload.content,
-            version=next_version,
-            is_active=payload.is_active,
-            is_stable=payload.is_stable,
-        )
-        self.session.add(prompt)
-        self.session.flush()
-        self._record_prompt_history(
-            project_id=project_id,
-            prompt=prompt,
+                ),
+                is_active=payload.is_active,
+                is_stable=payload.is_stable,
+            )
+            .on_conflict_do_nothing(),
             previous=latest,
             change_summary=payload.change_summary,
         )
@@ -772,34 +1469,32 @@ class DatabaseStore:
 
     def list_prompt_versions(self, project_id: int) -> List[schemas.PromptVersion]:
         self._require_project(project_id)
-        prompts = self.session.scalars(
-            select(models.PromptVersion).where(
+        return self._fetch_all(
+            select(*_PROMPT_VERSION_COLUMNS).where(
                 models.PromptVersion.project_id == project_id
-            )
-        ).all()
-        return [self._to_prompt_version(prompt) for prompt in prompts]
+            ),
+            schemas.PromptVersion,
+        )
 
     def list_prompt_version_history(
         self, project_id: int
     ) -> List[schemas.PromptVersionHistory]:
         self._require_project(project_id)
-        history = self.session.scalars(
-            select(models.PromptVersionHistory)
+        return self._fetch_all(
+            select(*_PROMPT_VERSION_HISTORY_COLUMNS)
             .where(models.PromptVersionHistory.project_id == project_id)
-            .order_by(models.PromptVersionHistory.created_at.desc())
-        ).all()
-        return [self._to_prompt_version_history(entry) for entry in history]
+            .order_by(models.PromptVersionHistory.created_at.desc()),
+            schemas.PromptVersionHistory,
+        )
 
     def set_prompt_version_stable(
         self, project_id: int, prompt_id: int, payload: schemas.StableVersionUpdate
     ) -> schemas.PromptVersion:
-        prompt = self.session.get(models.PromptVersion, prompt_id)
-        if not prompt or prompt.project_id != project_id:
-            raise KeyError("prompt_version_not_found")
+        prompt = self._get_owned(
+            models.PromptVersion, prompt_id, project_id, "prompt_version_not_found"
+        )
         previous = self._prompt_snapshot(prompt)
         prompt.is_stable = payload.is_stable
-        self.session.add(prompt)
-        self.session.flush()
         self.session.add(
             models.PromptVersionHistory(
                 project_id=project_id,
@@ -813,53 +1508,52 @@ class DatabaseStore:
                 },
             )
         )
+        self._flush()
         return self._to_prompt_version(prompt)
 
     def rollback_prompt_version(
         self, project_id: int, payload: schemas.PromptVersionRollback
     ) -> schemas.PromptVersion:
         self._require_project(project_id)
-        target = self.session.scalar(
-            select(models.PromptVersion).where(
-                models.PromptVersion.project_id == project_id,
-                models.PromptVersion.prompt_key == payload.prompt_key,
-                models.PromptVersion.version == payload.version,
-            )
+        self._lock_versions(project_id)
+        # The rollback target and the latest version come back in one query,
+        # newest first; they are the same row when rolling back to the tip.
+        versions = self.session.execute(
+            _SELECT_PROMPT_VERSION_AND_LATEST,
+            {
+                "project_id": project_id,
+                "prompt_key": payload.prompt_key,
+                "version": payload.version,
+            },
+        ).all()
+        target = next(
+            (row for row in versions if row.version == payload.version), None
         )
         if not target:
             raise KeyError("prompt_version_not_found")
         if not target.is_stable:
             raise ValueError("prompt_version_not_stable")
-        latest = self.session.scalar(
-            select(models.PromptVersion)
-            .where(
-                models.PromptVersion.project_id == project_id,
-                models.PromptVersion.prompt_key == payload.prompt_key,
-            )
-            .order_by(models.PromptVersion.version.desc())
-        )
-        next_version = latest.version + 1 if latest else 1
-        for active_prompt in self.session.scalars(
-            select(models.PromptVersion).where(
-                models.PromptVersion.project_id == project_id,
-                models.PromptVersion.prompt_key == payload.prompt_key,
-                models.PromptVersion.is_active.is_(True),
+        latest = versions[0]
+        self._deactivate(
+            models.PromptVersion,
+            models.PromptVersion.project_id == project_id,
+            models.PromptVersion.prompt_key == payload.prompt_key,
+        )
+        prompt = self._insert_prompt_version(
+            pg_insert(models.PromptVersion)
+            .values(
+                project_id=project_id,
+                prompt_key=target.prompt_key,
+                content=target.content,
+                version=self._next_version(
+                    models.PromptVersion.version,
+                    models.PromptVersion.project_id == project_id,
+                    models.PromptVersion.prompt_key == payload.prompt_key,
+                ),
+                is_active=True,
+                is_stable=False,
             )
-        ):
-            active_prompt.is_active = False
-        prompt = models.PromptVersion(
-            project_id=project_id,
-            prompt_key=target.prompt_key,
-            content=target.content,
-            version=next_version,
-            is_active=True,
-            is_stable=False,
-        )
-        self.session.add(prompt)
-        self.session.flush()
-        self._record_prompt_history(
-            project_id=project_id,
-            prompt=prompt,
+            .on_conflict_do_nothing(),
             previous=latest,
             change_summary=payload.change_summary
             or f"rollback_to_version_{target.version}",
@@ -873,7 +1567,7 @@ class DatabaseStore:
                 models.ProjectDataset.project_id == project_id
             )
         ).all()
-        return [self._to_project_dataset(dataset) for dataset in datasets]
+        return self._detach(datasets, self._to_project_dataset)
 
     def list_project_vector_indexes(
         self, project_id: int
@@ -884,42 +1578,84 @@ class DatabaseStore:
                 models.ProjectVectorIndex.project_id == project_id
             )
         ).all()
-        return [self._to_project_vector_index(index_) for index_ in indexes]
+        return self._detach(indexes, self._to_project_vector_index)
 
     def create_redirect_link(
         self, project_id: int, payload: schemas.RedirectLinkCreate
     ) -> schemas.RedirectLink:
-        project = self._require_project(project_id)
-        content_item = None
+        self._require_project(project_id)
         if payload.content_item_id is not None:
-            content_item = self.session.get(models.ContentItem, payload.content_item_id)
-            if not content_item or content_item.project_id != project_id:
-                raise KeyError("content_item_not_found")
+            self._require_owned(
+                models.ContentItem,
+                payload.content_item_id,
+                project_id,
+                "content_item_not_found",
+            )
         if not payload.slug:
             raise ValueError("redirect_slug_required")
-        link = models.RedirectLink(
-            project=project,
-            content_item=content_item,
-            slug=payload.slug,
-            target_url=payload.target_url,
-            utm_params=payload.utm_params,
-            is_active=payload.is_active,
+        link = self.session.scalar(
+            _INSERT_REDIRECT_LINK,
+            {
+                "project_id": project_id,
+                "content_item_id": payload.content_item_id,
+                "slug": payload.slug,
+                "target_url": payload.target_url,
+                "utm_params": payload.utm_params,
+                "is_active": payload.is_active,
+            },
         )
-        self.session.add(link)
-        self.session.flush()
+        _REDIRECT_LINKS.delete(link.slug)
         return self._to_redirect_link(link)
 
     def list_redirect_links(self, project_id: int) -> List[schemas.RedirectLink]:
         self._require_project(project_id)
-        links = self.session.scalars(
-            select(models.RedirectLink).where(models.RedirectLink.project_id == project_id)
-        ).all()
-        return [self._to_redirect_link(link) for link in links]
+        return self._fetch_all(
+            select(*_REDIRECT_LINK_COLUMNS).where(
+                models.RedirectLink.project_id == project_id
+            ),
+            schemas.RedirectLink,
+        )
 
-    def get_redirect_link_by_slug(self, slug: str) -> Optional[models.RedirectLink]:
-        return self.session.scalar(
-            select(models.RedirectLink).where(models.RedirectLink.slug == slug)
+    def list_redirect_links_with_counts(
+        self, project_id: int
+    ) -> List[tuple[schemas.RedirectLink, int]]:
+        self._require_project(project_id)
+        # Clicks are counted per link in one aggregate and joined back, so
+        # dashboards need neither a count query per link nor wide GROUP BY rows.
+        clicks = (
+            select(
+                models.ClickEvent.redirect_link_id,
+                func.count(models.ClickEvent.id).label("click_count"),
+            )
+            .where(models.ClickEvent.project_id == project_id)
+            .group_by(models.ClickEvent.redirect_link_id)
+            .subquery()
         )
+        rows = self.session.execute(
+            select(
+                *_REDIRECT_LINK_COLUMNS,
+                func.coalesce(clicks.c.click_count, 0).label("click_count"),
+            )
+            .outerjoin(clicks, clicks.c.redirect_link_id == models.RedirectLink.id)
+            .where(models.RedirectLink.project_id == project_id)
+        )
+        validate = schemas.RedirectLink.model_validate
+        return [(validate(row._mapping), row.click_count) for row in rows]
+
+    def get_redirect_link_by_slug(self, slug: str) -> Optional[schemas.RedirectLink]:
+        # Returns the schema, not the ORM row, so a Redis hit and a database
+        # hit look the same to callers; the result is detached and read-only.
+        link = _REDIRECT_LINKS.get(slug)
+        if link is not None:
+            return link
+        row = self.session.execute(
+            _SELECT_REDIRECT_LINK_BY_SLUG, {"slug": slug}
+        ).mappings().first()
+        if row is None:
+            return None
+        link = schemas.RedirectLink.model_validate(row)
+        _REDIRECT_LINKS.set(link)
+        return link
 
     def create_click_event(
         self,
@@ -932,27 +1668,72 @@ class DatabaseStore:
         utm_params: dict,
         query_params: dict,
     ) -> schemas.ClickEvent:
-        project = self._require_project(project_id)
-        link = self.session.get(models.RedirectLink, redirect_link_id)
-        if not link or link.project_id != project_id:
-            raise KeyError("redirect_link_not_found")
-        content_item = None
+        self._require_project(project_id)
+        self._require_owned(
+            models.RedirectLink, redirect_link_id, project_id, "redirect_link_not_found"
+        )
         if content_item_id is not None:
-            content_item = self.session.get(models.ContentItem, content_item_id)
-            if not content_item or content_item.project_id != project_id:
-                raise KeyError("content_item_not_found")
-        event = models.ClickEvent(
-            project=project,
-            redirect_link=link,
-            content_item=content_item,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            referrer=referrer,
-            utm_params=utm_params,
-            query_params=query_params,
-        )
-        self.session.add(event)
-        self.session.flush()
+            self._require_owned(
+                models.ContentItem, content_item_id, project_id, "content_item_not_found"
+            )
+        return self._insert_click_event(
+            project_id,
+            redirect_link_id,
+            content_item_id,
+            ip_address,
+            user_agent,
+            referrer,
+            utm_params,
+            query_params,
+        )
+
+    def record_click(
+        self,
+        link: schemas.RedirectLink,
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+        referrer: Optional[str],
+        utm_params: dict,
+        query_params: dict,
+    ) -> schemas.ClickEvent:
+        # The link came from get_redirect_link_by_slug, so its project and
+        # content item ids are the row's own; foreign keys still guard the
+        # insert, and the redirect path skips the ownership SELECTs.
+        return self._insert_click_event(
+            link.project_id,
+            link.id,
+            link.content_item_id,
+            ip_address,
+            user_agent,
+            referrer,
+            utm_params,
+            query_params,
+        )
+
+    def _insert_click_event(
+        self,
+        project_id: int,
+        redirect_link_id: int,
+        content_item_id: Optional[int],
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+        referrer: Optional[str],
+        utm_params: dict,
+        query_params: dict,
+    ) -> schemas.ClickEvent:
+        event = self.session.scalar(
+            _INSERT_CLICK_EVENT,
+            {
+                "project_id": project_id,
+                "redirect_link_id": redirect_link_id,
+                "content_item_id": content_item_id,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "referrer": referrer,
+                "utm_params": utm_params,
+                "query_params": query_params,
+            },
+        )
         return self._to_click_event(event)
 
     def list_click_events(
@@ -960,17 +1741,48 @@ class DatabaseStore:
         project_id: int,
         redirect_link_id: Optional[int] = None,
         content_item_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ) -> List[schemas.ClickEvent]:
+        return self._fetch_all(
+            self._select_click_events(
+                project_id, redirect_link_id, content_item_id, after_id, limit
+            ),
+            schemas.ClickEvent,
+        )
+
+    def iter_click_events(
+        self,
+        project_id: int,
+        redirect_link_id: Optional[int] = None,
+        content_item_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[schemas.ClickEvent]:
+        return self._stream(
+            self._select_click_events(
+                project_id, redirect_link_id, content_item_id, after_id, limit
+            ),
+            schemas.ClickEvent,
+        )
+
+    def _select_click_events(
+        self,
+        project_id: int,
+        redirect_link_id: Optional[int],
+        content_item_id: Optional[int],
+        after_id: Optional[int],
+        limit: Optional[int],
+    ) -> Select:
         self._require_project(project_id)
-        query = select(models.ClickEvent).where(
+        query = select(*_CLICK_EVENT_COLUMNS).where(
             models.ClickEvent.project_id == project_id
         )
         if redirect_link_id is not None:
             query = query.where(models.ClickEvent.redirect_link_id == redirect_link_id)
         if content_item_id is not None:
             query = query.where(models.ClickEvent.content_item_id == content_item_id)
-        events = self.session.scalars(query).all()
-        return [self._to_click_event(event) for event in events]
+        return self._paginate(query, models.ClickEvent, after_id, limit)
 
     def count_clicks(self, project_id: int, content_item_id: int) -> int:
         self._require_project(project_id)
@@ -984,15 +1796,29 @@ class DatabaseStore:
             or 0
         )
 
+    def count_clicks_bulk(
+        self, project_id: int, content_item_ids: List[int]
+    ) -> dict[int, int]:
+        self._require_project(project_id)
+        if not content_item_ids:
+            return {}
+        rows = self.session.execute(
+            select(models.ClickEvent.content_item_id, func.count(models.ClickEvent.id))
+            .where(
+                models.ClickEvent.project_id == project_id,
+                models.ClickEvent.content_item_id.in_(content_item_ids),
+            )
+            .group_by(models.ClickEvent.content_item_id)
+        )
+        return dict(rows.tuples())
+
     def get_integration_token_by_provider(
         self, project_id: int, provider: str
     ) -> Optional[schemas.IntegrationToken]:
         self._require_project(project_id)
         token = self.session.scalar(
-            select(models.IntegrationToken).where(
-                models.IntegrationToken.project_id == project_id,
-                models.IntegrationToken.provider == provider,
-            )
+            _SELECT_INTEGRATION_TOKEN_BY_PROVIDER,
+            {"project_id": project_id, "provider": provider},
         )
         if not token:
             return None
@@ -1001,463 +1827,415 @@ class DatabaseStore:
     def create_integration_token(
         self, project_id: int, payload: schemas.IntegrationTokenCreate
     ) -> schemas.IntegrationToken:
-        project = self._require_project(project_id)
-        token = models.IntegrationToken(
-            project=project,
-            provider=payload.provider,
-            token_encrypted=encrypt_secret(payload.token),
+        self._require_project(project_id)
+        token = self.session.scalar(
+            _INSERT_INTEGRATION_TOKEN,
+            {
+                "project_id": project_id,
+                "provider": payload.provider,
+                "token_encrypted": encrypt_secret(payload.token),
+            },
         )
-        self.session.add(token)
-        self.session.flush()
         return self._to_integration_token(token)
 
     def list_integration_tokens(self, project_id: int) -> List[schemas.IntegrationToken]:
         self._require_project(project_id)
-        tokens = self.session.scalars(
-            select(models.IntegrationToken).where(
+        # Rows expose the same attributes as the entity, including
+        # token_encrypted, so the decrypting mapper works on them unchanged.
+        rows = self.session.execute(
+            select(*_INTEGRATION_TOKEN_COLUMNS).where(
                 models.IntegrationToken.project_id == project_id
             )
-        ).all()
-        return [self._to_integration_token(token) for token in tokens]
+        )
+        return list(map(self._to_integration_token, rows))
 
     def get_integration_token(
         self, project_id: int, token_id: int
     ) -> schemas.IntegrationToken:
-        token = self.session.get(models.IntegrationToken, token_id)
-        if not token or token.project_id != project_id:
-            raise KeyError("integration_token_not_found")
+        token = self._get_owned(
+            models.IntegrationToken, token_id, project_id, "integration_token_not_found"
+        )
         return self._to_integration_token(token)
 
     def update_integration_token(
         self, project_id: int, token_id: int, payload: schemas.IntegrationTokenUpdate
     ) -> schemas.IntegrationToken:
-        token = self.session.get(models.IntegrationToken, token_id)
-        if not token or token.project_id != project_id:
-            raise KeyError("integration_token_not_found")
+        token = self._get_owned(
+            models.IntegrationToken, token_id, project_id, "integration_token_not_found"
+        )
         token.token_encrypted = encrypt_secret(payload.token)
         self.session.add(token)
-        self.session.flush()
+        self._flush()
         return self._to_integration_token(token)
 
     def delete_integration_token(self, project_id: int, token_id: int) -> None:
-        token = self.session.get(models.IntegrationToken, token_id)
-        if not token or token.project_id != project_id:
-            raise KeyError("integration_token_not_found")
+        token = self._get_owned(
+            models.IntegrationToken, token_id, project_id, "integration_token_not_found"
+        )
         self.session.delete(token)
 
     def create_alert(self, project_id: int, payload: schemas.AlertCreate) -> schemas.Alert:
-        project = self._require_project(project_id)
-        alert = models.Alert(
-            project=project,
-            alert_type=payload.alert_type,
-            severity=payload.severity,
-            message=payload.message,
-            metadata=payload.metadata,
-        )
-        self.session.add(alert)
-        self.session.flush()
+        self._require_project(project_id)
+        alert = self.session.scalar(
+            _INSERT_ALERT,
+            {
+                "project_id": project_id,
+                "alert_type": payload.alert_type,
+                "severity": payload.severity,
+                "message": payload.message,
+                "metadata": payload.metadata,
+            },
+        )
         return self._to_alert(alert)
 
-    def list_alerts(self, project_id: int) -> List[schemas.Alert]:
-        self._require_project(project_id)
-        alerts = self.session.scalars(
-            select(models.Alert).where(models.Alert.project_id == project_id)
-        ).all()
-        return [self._to_alert(alert) for alert in alerts]
+    def list_alerts(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[schemas.Alert]:
+        return self._fetch_all(
+            self._select_alerts(project_id, after_id, limit), schemas.Alert
+        )
 
-    def _require_project(self, project_id: int) -> models.Project:
-        project = self.session.get(models.Project, project_id)
-        if not project:
+    def iter_alerts(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[schemas.Alert]:
+        return self._stream(
+            self._select_alerts(project_id, after_id, limit), schemas.Alert
+        )
+
+    def _select_alerts(
+        self, project_id: int, after_id: Optional[int], limit: Optional[int]
+    ) -> Select:
+        self._require_project(project_id)
+        return self._paginate(
+            select(*_ALERT_COLUMNS).where(models.Alert.project_id == project_id),
+            models.Alert,
+            after_id,
+            limit,
+        )
+
+    def _require_project(self, project_id: int) -> None:
+        if project_id in self._validated_projects:
+            return
+        # A Project this session loaded in the current transaction needs no
+        # round trip either. Expired rows (after commit/rollback) may have
+        # been deleted since, and rows pending deletion are gone on flush.
+        project = self.session.identity_map.get(
+            self.session.identity_key(models.Project, project_id)
+        )
+        if project is not None:
+            state = inspect(project)
+            if state.persistent and not state.expired and project not in self.session.deleted:
+                self._validated_projects.add(project_id)
+                return
+        exists = self.session.scalar(_SELECT_PROJECT_ID, {"project_id": project_id})
+        if exists is None:
             raise KeyError("project_not_found")
-        return project
+        self._validated_projects.add(project_id)
 
     @staticmethod
-    def _to_project(project: models.Project) -> schemas.Project:
-        return schemas.Project(
-            id=project.id,
-            name=project.name,
-            description=project.description,
-            status=project.status,
-            created_at=project.created_at,
-        )
+    def _next_version(column: Any, *criteria: Any) -> ScalarSelect:
+        return (
+            select(func.coalesce(func.max(column), 0) + 1)
+            .where(*criteria)
+            .scalar_subquery()
+        )
+
+    def _lock_versions(self, project_id: int) -> None:
+        # Held until commit or rollback. A writer that waited here sees the
+        # previous writer's rows, so _deactivate switches off the row it made
+        # active and MAX + 1 is free; without the lock the losing writer's
+        # retries keep hitting the other active row.
+        self.session.execute(_LOCK_PROJECT_VERSIONS, {"project_id": project_id})
+
+    def _insert_next_version(self, statement: Executable, error: str) -> Any:
+        # Writers hold _lock_versions, so a conflict here means a row written
+        # outside it (e.g. by a migration or manual SQL); either unique index
+        # turns that into an empty RETURNING and the retry recomputes MAX + 1.
+        for _ in range(_VERSION_INSERT_ATTEMPTS):
+            row = self.session.scalar(statement)
+            if row is not None:
+                return row
+        raise ValueError(error)
 
     @staticmethod
-    def _to_brand_config(config: models.BrandConfig) -> schemas.BrandConfig:
-        return schemas.BrandConfig(
-            id=config.id,
-            project_id=config.project_id,
-            version=config.version,
-            is_active=config.is_active,
-            tone=config.tone,
-            audience=config.audience,
-            offers=config.offers,
-            rubrics=config.rubrics,
-            forbidden=config.forbidden,
-            cta_policy=config.cta_policy,
-            is_stable=config.is_stable,
-            created_at=config.created_at,
+    def _paginate(
+        statement: Select, model: type, after_id: Optional[int], limit: Optional[int]
+    ) -> Select:
+        # Keyset pagination on the primary key: the next page starts after the
+        # last id the caller saw, so no OFFSET scan is needed.
+        if after_id is None and limit is None:
+            return statement
+        if after_id is not None:
+            statement = statement.where(model.id > after_id)
+        statement = statement.order_by(model.id)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
+    def _stream(self, statement: Select, schema: type[BaseModel]) -> Iterator[Any]:
+        # Column rows skip ORM hydration and the identity map entirely;
+        # pydantic validates each RowMapping as a plain mapping.
+        rows = self.session.execute(
+            statement.execution_options(yield_per=_STREAM_BATCH_SIZE)
+        ).mappings()
+        return map(schema.model_validate, rows)
+
+    def _fetch_all(self, statement: Select, schema: type[BaseModel]) -> list:
+        # One TypeAdapter call validates the whole result list inside
+        # pydantic-core instead of a model_validate call per row.
+        rows = self.session.execute(statement).mappings().all()
+        return _list_adapter(schema).validate_python(rows)
+
+    def _detach(self, rows: Sequence[Any], mapper: Callable[[Any], Any]) -> list:
+        """Map rows to schemas and drop them from the identity map.
+
+        Callers get schemas only, so the ORM objects must not be used after
+        this returns.
+        """
+        result = list(map(mapper, rows))
+        expunge = self._expunge
+        for row in rows:
+            expunge(row)
+        return result
+
+    def _expunge(self, row: Any) -> None:
+        # Rows with unflushed changes stay attached so the commit still writes them.
+        if not inspect(row).modified:
+            self.session.expunge(row)
+
+    def _deactivate(self, model: type, *criteria: Any) -> None:
+        self.session.execute(
+            update(model)
+            .where(*criteria, model.is_active.is_(True))
+            .values(is_active=False)
+        )
+
+    def _get_owned(
+        self, model: type, object_id: int, project_id: int, error: str, *options: Any
+    ) -> Any:
+        row = self.session.scalar(
+            select(model)
+            .where(model.id == object_id, model.project_id == project_id)
+            .options(*options)
+        )
+        if row is None:
+            raise KeyError(error)
+        return row
+
+    def _require_owned(
+        self, model: type, object_id: int, project_id: int, error: str
+    ) -> None:
+        owned = self.session.scalar(
+            select(model.id).where(model.id == object_id, model.project_id == project_id)
         )
+        if owned is None:
+            raise KeyError(error)
+        self._validated_projects.add(project_id)
 
-    @staticmethod
-    def _to_budget(budget: models.Budget) -> schemas.Budget:
-        return schemas.Budget(
-            id=budget.id,
-            project_id=budget.project_id,
-            daily=budget.daily,
-            weekly=budget.weekly,
-            monthly=budget.monthly,
-            token_limit=budget.token_limit,
-            video_seconds_limit=budget.video_seconds_limit,
-            publication_limit=budget.publication_limit,
-            created_at=budget.created_at,
-        )
+    _to_project = staticmethod(_construct_mapper(schemas.Project, models.Project))
 
-    @staticmethod
-    def _to_budget_usage(usage: models.BudgetUsage) -> schemas.BudgetUsage:
-        return schemas.BudgetUsage(
-            id=usage.id,
-            budget_id=usage.budget_id,
-            project_id=usage.project_id,
-            usage_date=usage.usage_date,
-            token_used=usage.token_used,
-            video_seconds_used=usage.video_seconds_used,
-            publications_used=usage.publications_used,
-            created_at=usage.created_at,
-        )
+    _to_brand_config = staticmethod(
+        _construct_mapper(schemas.BrandConfig, models.BrandConfig)
+    )
 
-    @staticmethod
-    def _to_source(source: models.Source) -> schemas.Source:
-        return schemas.Source(
-            id=source.id,
-            project_id=source.project_id,
-            title=source.title,
-            source_type=source.source_type,
-            uri=source.uri,
-            content=source.content,
-            artifact_uri=source.artifact_uri,
-            artifact_version=source.artifact_version,
-            artifact_metadata=source.artifact_metadata,
-            status=source.status,
-            is_current=source.is_current,
-            created_at=source.created_at,
-        )
+    _to_budget = staticmethod(_construct_mapper(schemas.Budget, models.Budget))
 
-    @staticmethod
-    def _to_atom(atom: models.Atom) -> schemas.Atom:
-        return schemas.Atom(
-            id=atom.id,
-            project_id=atom.project_id,
-            source_id=atom.source_id,
-            kind=atom.kind,
-            text=atom.text,
-            source_backed=atom.source_backed,
-            embedding=atom.embedding,
-            source_uri=atom.source_uri,
-            source_version=atom.source_version,
-            artifact_uri=atom.artifact_uri,
-            artifact_version=atom.artifact_version,
-            artifact_metadata=atom.artifact_metadata,
-            status=atom.status,
-            is_current=atom.is_current,
-            created_at=atom.created_at,
-        )
+    _to_budget_usage = staticmethod(
+        _construct_mapper(schemas.BudgetUsage, models.BudgetUsage)
+    )
 
-    @staticmethod
-    def _to_topic(topic: models.Topic) -> schemas.Topic:
-        return schemas.Topic(
-            id=topic.id,
-            project_id=topic.project_id,
-            title=topic.title,
-            angle=topic.angle,
-            rubric=topic.rubric,
-            planned_for=topic.planned_for,
-            status=topic.status,
-            created_at=topic.created_at,
-        )
+    _to_source = staticmethod(_construct_mapper(schemas.Source, models.Source))
 
-    @staticmethod
-    def _to_content_pack(pack: models.ContentPack) -> schemas.ContentPack:
-        return schemas.ContentPack(
-            id=pack.id,
-            project_id=pack.project_id,
-            topic_id=pack.topic_id,
-            description=pack.description,
-            status=pack.status,
-            created_at=pack.created_at,
-        )
+    # Atoms stay validated: pgvector hands embeddings back as arrays that the
+    # schema has to coerce into plain float lists.
+    _to_atom = staticmethod(schemas.Atom.model_validate)
 
-    @staticmethod
-    def _to_content_item(item: models.ContentItem) -> schemas.ContentItem:
-        return schemas.ContentItem(
-            id=item.id,
-            project_id=item.project_id,
-            pack_id=item.pack_id,
-            channel=item.channel,
-            format=item.format,
-            body=item.body,
-            metadata=item.metadata,
-            status=item.status,
-            created_at=item.created_at,
-        )
+    _to_topic = staticmethod(_construct_mapper(schemas.Topic, models.Topic))
 
-    @staticmethod
-    def _to_qc_report(report: models.QcReport) -> schemas.QcReport:
-        return schemas.QcReport(
-            id=report.id,
-            project_id=report.project_id,
-            content_item_id=report.content_item_id,
-            score=report.score,
-            passed=report.passed,
-            reasons=report.reasons,
-            created_at=report.created_at,
-        )
+    _to_content_pack = staticmethod(
+        _construct_mapper(schemas.ContentPack, models.ContentPack)
+    )
 
-    @staticmethod
-    def _to_publication(publication: models.Publication) -> schemas.Publication:
-        return schemas.Publication(
-            id=publication.id,
-            project_id=publication.project_id,
-            content_item_id=publication.content_item_id,
-            platform=publication.platform,
-            scheduled_at=publication.scheduled_at,
-            status=publication.status,
-            platform_post_id=publication.platform_post_id,
-            platform_post_url=publication.platform_post_url,
-            published_at=publication.published_at,
-            idempotency_key=publication.idempotency_key,
-            attempt_count=publication.attempt_count,
-            last_error=publication.last_error,
-        )
+    _to_content_item = staticmethod(
+        _construct_mapper(schemas.ContentItem, models.ContentItem)
+    )
 
-    @staticmethod
-    def _to_metric_snapshot(snapshot: models.MetricSnapshot) -> schemas.MetricSnapshot:
-        return schemas.MetricSnapshot(
-            id=snapshot.id,
-            project_id=snapshot.project_id,
-            content_item_id=snapshot.content_item_id,
-            impressions=snapshot.impressions,
-            clicks=snapshot.clicks,
-            likes=snapshot.likes,
-            comments=snapshot.comments,
-            shares=snapshot.shares,
-            collected_at=snapshot.collected_at,
-        )
+    _to_qc_report = staticmethod(_construct_mapper(schemas.QcReport, models.QcReport))
 
-    @staticmethod
-    def _to_redirect_link(link: models.RedirectLink) -> schemas.RedirectLink:
-        return schemas.RedirectLink(
-            id=link.id,
-            project_id=link.project_id,
-            content_item_id=link.content_item_id,
-            target_url=link.target_url,
-            slug=link.slug,
-            utm_params=link.utm_params,
-            is_active=link.is_active,
-            created_at=link.created_at,
-        )
+    _to_publication = staticmethod(
+        _construct_mapper(schemas.Publication, models.Publication)
+    )
 
-    @staticmethod
-    def _to_click_event(event: models.ClickEvent) -> schemas.ClickEvent:
-        return schemas.ClickEvent(
-            id=event.id,
-            project_id=event.project_id,
-            redirect_link_id=event.redirect_link_id,
-            content_item_id=event.content_item_id,
-            ip_address=event.ip_address,
-            user_agent=event.user_agent,
-            referrer=event.referrer,
-            utm_params=event.utm_params,
-            query_params=event.query_params,
-            clicked_at=event.clicked_at,
-        )
+    _to_metric_snapshot = staticmethod(
+        _construct_mapper(schemas.MetricSnapshot, models.MetricSnapshot)
+    )
 
-    @staticmethod
-    def _to_learning_event(event: models.LearningEvent) -> schemas.LearningEvent:
-        return schemas.LearningEvent(
-            id=event.id,
-            project_id=event.project_id,
-            parameter=event.parameter,
-            previous_value=event.previous_value,
-            new_value=event.new_value,
-            reason=event.reason,
-            created_at=event.created_at,
-        )
+    _to_redirect_link = staticmethod(
+        _construct_mapper(schemas.RedirectLink, models.RedirectLink)
+    )
 
-    @staticmethod
-    def _to_auto_learning_config(
-        config: models.AutoLearningConfig,
-    ) -> schemas.AutoLearningConfig:
-        return schemas.AutoLearningConfig(
-            id=config.id,
-            project_id=config.project_id,
-            max_changes_per_week=config.max_changes_per_week,
-            rollback_threshold=config.rollback_threshold,
-            rollback_window=config.rollback_window,
-            protected_parameters=config.protected_parameters,
-            created_at=config.created_at,
-        )
+    _to_click_event = staticmethod(
+        _construct_mapper(schemas.ClickEvent, models.ClickEvent)
+    )
 
-    @staticmethod
-    def _to_auto_learning_state(
-        state: models.AutoLearningState,
-    ) -> schemas.AutoLearningState:
-        return schemas.AutoLearningState(
-            id=state.id,
-            project_id=state.project_id,
-            parameters=state.parameters,
-            stable_parameters=state.stable_parameters,
-            window_started_at=state.window_started_at,
-            changes_in_window=state.changes_in_window,
-            last_change_at=state.last_change_at,
-            last_rollback_at=state.last_rollback_at,
-            created_at=state.created_at,
-        )
+    _to_learning_event = staticmethod(
+        _construct_mapper(schemas.LearningEvent, models.LearningEvent)
+    )
 
-    @staticmethod
-    def _to_prompt_version(prompt: models.PromptVersion) -> schemas.PromptVersion:
-        return schemas.PromptVersion(
-            id=prompt.id,
-            project_id=prompt.project_id,
-            prompt_key=prompt.prompt_key,
-            content=prompt.content,
-            version=prompt.version,
-            is_active=prompt.is_active,
-            is_stable=prompt.is_stable,
-            created_at=prompt.created_at,
-        )
+    _to_auto_learning_config = staticmethod(
+        _construct_mapper(schemas.AutoLearningConfig, models.AutoLearningConfig)
+    )
 
-    @staticmethod
-    def _to_brand_config_history(
-        entry: models.BrandConfigHistory,
-    ) -> schemas.BrandConfigHistory:
-        return schemas.BrandConfigHistory(
-            id=entry.id,
-            project_id=entry.project_id,
-            brand_config_id=entry.brand_config_id,
-            version=entry.version,
-            change_summary=entry.change_summary,
-            change_payload=entry.change_payload,
-            created_at=entry.created_at,
-        )
+    _to_auto_learning_state = staticmethod(
+        _construct_mapper(schemas.AutoLearningState, models.AutoLearningState)
+    )
 
-    @staticmethod
-    def _to_prompt_version_history(
-        entry: models.PromptVersionHistory,
-    ) -> schemas.PromptVersionHistory:
-        return schemas.PromptVersionHistory(
-            id=entry.id,
-            project_id=entry.project_id,
-            prompt_version_id=entry.prompt_version_id,
-            prompt_key=entry.prompt_key,
-            version=entry.version,
-            change_summary=entry.change_summary,
-            change_payload=entry.change_payload,
-            created_at=entry.created_at,
-        )
+    _to_prompt_version = staticmethod(
+        _construct_mapper(schemas.PromptVersion, models.PromptVersion)
+    )
 
-    @staticmethod
-    def _to_project_dataset(dataset: models.ProjectDataset) -> schemas.ProjectDataset:
-        return schemas.ProjectDataset(
-            id=dataset.id,
-            project_id=dataset.project_id,
-            name=dataset.name,
-            kind=dataset.kind,
-            storage_uri=dataset.storage_uri,
-            is_active=dataset.is_active,
-            created_at=dataset.created_at,
-        )
+    _to_brand_config_history = staticmethod(
+        _construct_mapper(schemas.BrandConfigHistory, models.BrandConfigHistory)
+    )
 
-    @staticmethod
-    def _to_project_vector_index(
-        index_: models.ProjectVectorIndex,
-    ) -> schemas.ProjectVectorIndex:
-        return schemas.ProjectVectorIndex(
-            id=index_.id,
-            project_id=index_.project_id,
-            name=index_.name,
-            provider=index_.provider,
-            embedding_dimension=index_.embedding_dimension,
-            metadata=index_.metadata,
-            created_at=index_.created_at,
+    _to_prompt_version_history = staticmethod(
+        _construct_mapper(schemas.PromptVersionHistory, models.PromptVersionHistory)
+    )
+
+    _to_project_dataset = staticmethod(
+        _construct_mapper(schemas.ProjectDataset, models.ProjectDataset)
+    )
+
+    _to_project_vector_index = staticmethod(
+        _construct_mapper(schemas.ProjectVectorIndex, models.ProjectVectorIndex)
+    )
+
+    def _to_content_item_expanded(
+        self, item: models.ContentItem
+    ) -> schemas.ContentItemExpanded:
+        return schemas.ContentItemExpanded(
+            **self._to_content_item(item).model_dump(),
+            qc_reports=[self._to_qc_report(report) for report in item.qc_reports],
+            publications=[
+                self._to_publication(publication) for publication in item.publications
+            ],
+            metric_snapshots=[
+                self._to_metric_snapshot(snapshot)
+                for snapshot in item.metric_snapshots
+            ],
         )
 
     @staticmethod
     def _brand_config_snapshot(config: models.BrandConfig) -> dict:
-        return {
-            "id": config.id,
-            "version": config.version,
-            "is_active": config.is_active,
-            "is_stable": config.is_stable,
-            "tone": config.tone,
-            "audience": config.audience,
-            "offers": config.offers,
-            "rubrics": config.rubrics,
-            "forbidden": config.forbidden,
-            "cta_policy": config.cta_policy,
-        }
+        return dict(
+            zip(_BRAND_CONFIG_SNAPSHOT_FIELDS, _get_brand_config_snapshot(config))
+        )
 
     @staticmethod
-    def _prompt_snapshot(prompt: models.PromptVersion) -> dict:
-        return {
-            "id": prompt.id,
-            "prompt_key": prompt.prompt_key,
-            "version": prompt.version,
-            "is_active": prompt.is_active,
-            "is_stable": prompt.is_stable,
-            "content": prompt.content,
-        }
+    def _prompt_snapshot(prompt: Any) -> dict:
+        # Accepts a PromptVersion or a column Row; both expose the fields as
+        # attributes.
+        return dict(zip(_PROMPT_SNAPSHOT_FIELDS, _get_prompt_snapshot(prompt)))
 
-    def _record_brand_config_history(
+    def _insert_brand_config(
         self,
-        project_id: int,
-        config: models.BrandConfig,
+        statement: Insert,
         previous: Optional[models.BrandConfig],
         change_summary: Optional[str],
-    ) -> None:
+    ) -> models.BrandConfig:
         default_summary = "brand_config_created" if previous is None else "brand_config_updated"
-        history = models.BrandConfigHistory(
-            project_id=project_id,
-            brand_config_id=config.id,
-            version=config.version,
-            change_summary=change_summary or default_summary,
-            change_payload={
-                "previous": self._brand_config_snapshot(previous)
-                if previous
-                else None,
-                "current": self._brand_config_snapshot(config),
+        previous_snapshot = self._brand_config_snapshot(previous) if previous else None
+        return self._insert_with_history(
+            statement,
+            models.BrandConfig,
+            models.BrandConfigHistory,
+            lambda inserted: {
+                "project_id": inserted.project_id,
+                "brand_config_id": inserted.id,
+                "version": inserted.version,
+                "change_summary": literal(change_summary or default_summary),
+                "change_payload": self._history_payload(
+                    previous_snapshot, inserted, _BRAND_CONFIG_SNAPSHOT_FIELDS
+                ),
             },
+            "brand_config_version_conflict",
         )
-        self.session.add(history)
 
-    def _record_prompt_history(
+    def _insert_prompt_version(
         self,
-        project_id: int,
-        prompt: models.PromptVersion,
-        previous: Optional[models.PromptVersion],
+        statement: Insert,
+        previous: Optional[Any],
         change_summary: Optional[str],
-    ) -> None:
+    ) -> models.PromptVersion:
         default_summary = "prompt_version_created" if previous is None else "prompt_version_updated"
-        history = models.PromptVersionHistory(
-            project_id=project_id,
-            prompt_version_id=prompt.id,
-            prompt_key=prompt.prompt_key,
-            version=prompt.version,
-            change_summary=change_summary or default_summary,
-            change_payload={
-                "previous": self._prompt_snapshot(previous) if previous else None,
-                "current": self._prompt_snapshot(prompt),
+        previous_snapshot = self._prompt_snapshot(previous) if previous else None
+        return self._insert_with_history(
+            statement,
+            models.PromptVersion,
+            models.PromptVersionHistory,
+            lambda inserted: {
+                "project_id": inserted.project_id,
+                "prompt_version_id": inserted.id,
+                "prompt_key": inserted.prompt_key,
+                "version": inserted.version,
+                "change_summary": literal(change_summary or default_summary),
+                "change_payload": self._history_payload(
+                    previous_snapshot, inserted, _PROMPT_SNAPSHOT_FIELDS
+                ),
             },
+            "prompt_version_conflict",
+        )
+
+    def _insert_with_history(
+        self,
+        statement: Insert,
+        model: type,
+        history_model: type,
+        history_values: Callable[[Any], dict],
+        error: str,
+    ) -> Any:
+        # WITH inserted AS (INSERT ... RETURNING *),
+        #      history AS (INSERT INTO <history> SELECT ... FROM inserted)
+        # SELECT * FROM inserted
+        # A version conflict leaves "inserted" empty, so no history row is
+        # written and _insert_next_version retries the pair.
+        inserted = statement.returning(*model.__table__.columns).cte("inserted")
+        values = history_values(inserted.c)
+        history = (
+            insert(history_model)
+            .from_select(list(values), select(*values.values()))
+            .returning(history_model.id)
+            .cte("history")
+        )
+        return self._insert_next_version(
+            select(aliased(model, inserted)).add_cte(history), error
         )
-        self.session.add(history)
 
     @staticmethod
-    def _to_role(role: models.Role) -> schemas.Role:
-        return schemas.Role(
-            id=role.id,
-            name=role.name,
-            created_at=role.created_at,
+    def _history_payload(
+        previous: Optional[dict], inserted: Any, fields: tuple[str, ...]
+    ) -> Any:
+        return func.jsonb_build_object(
+            literal_column("'previous'"),
+            cast(literal(previous, JSONB), JSONB),
+            literal_column("'current'"),
+            func.jsonb_build_object(
+                *(
+                    part
+                    for name in fields
+                    for part in (literal_column(f"'{name}'"), inserted[name])
+                )
+            ),
         )
 
+    _to_role = staticmethod(_construct_mapper(schemas.Role, models.Role))
+
     @staticmethod
     def to_user_schema(user: models.User) -> schemas.User:
         roles = sorted({user_role.role.name for user_role in user.user_roles})
@@ -1480,14 +2258,4 @@ class DatabaseStore:
             updated_at=token.updated_at,
         )
 
-    @staticmethod
-    def _to_alert(alert: models.Alert) -> schemas.Alert:
-        return schemas.Alert(
-            id=alert.id,
-            project_id=alert.project_id,
-            alert_type=alert.alert_type,
-            severity=alert.severity,
-            message=alert.message,
-            metadata=alert.metadata,
-            created_at=alert.created_at,
-        )
+    _to_alert = staticmethod(_construct_mapper(schemas.Alert, models.Alert))
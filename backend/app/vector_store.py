@@ -1,16 +1,37 @@
 from __future__ import annotations
 
-from typing import List
+import os
+from typing import List, Sequence, Tuple
 
-from sqlalchemy import select
+import numpy as np
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import Float, bindparam, cast, func, select, update
 from sqlalchemy.orm import Session
 
 from . import models
 
+# pgvector's HNSW candidate list size; its built-in default is 40. Results are
+# filtered by project after the index scan, so multi-project databases may
+# need a larger list to return `limit` rows.
+_PGVECTOR_DEFAULT_EF_SEARCH = 40
+HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", str(_PGVECTOR_DEFAULT_EF_SEARCH)))
+
+_SELECT_PROJECT_VECTOR_INDEX = select(models.ProjectVectorIndex).where(
+    models.ProjectVectorIndex.project_id == bindparam("project_id")
+)
+
+
+def normalize_embedding(embedding: Sequence[float]) -> np.ndarray:
+    """Scale an embedding to unit length so inner product equals cosine."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
 
 class VectorStore:
     def __init__(self, session: Session) -> None:
         self.session = session
+        self._indexes: dict[int, models.ProjectVectorIndex] = {}
 
     def upsert_atom_embedding(
         self, project_id: int, atom_id: int, embedding: List[float]
@@ -22,27 +43,69 @@ class VectorStore:
         atom.embedding = embedding
         self.session.add(atom)
 
+    def upsert_atom_embeddings_bulk(
+        self, project_id: int, items: Sequence[Tuple[int, List[float]]]
+    ) -> None:
+        if not items:
+            return
+        self._require_project_index(project_id)
+        atoms = models.Atom.__table__
+        self.session.execute(
+            update(atoms)
+            .where(atoms.c.id == bindparam("atom_id"), atoms.c.project_id == project_id)
+            .values(embedding=bindparam("embedding")),
+            [{"atom_id": atom_id, "embedding": embedding} for atom_id, embedding in items],
+        )
+
     def search_atoms(
         self, project_id: int, embedding: List[float], limit: int = 5
     ) -> List[models.Atom]:
         self._require_project_index(project_id)
+        ef_search = max(HNSW_EF_SEARCH, limit)
+        if ef_search != _PGVECTOR_DEFAULT_EF_SEARCH:
+            # Transaction-local, so pooled connections keep the server default.
+            self.session.execute(
+                select(func.set_config("hnsw.ef_search", str(ef_search), True))
+            )
         stmt = (
             select(models.Atom)
             .where(models.Atom.project_id == project_id)
-            .order_by(models.Atom.embedding.cosine_distance(embedding))
+            .order_by(self._halfvec_inner_product(embedding))
             .limit(limit)
         )
         return self.session.scalars(stmt).all()
 
+    @staticmethod
+    def _halfvec_inner_product(embedding: List[float]):
+        # Both sides are unit length, so the negative inner product (<#>)
+        # orders like cosine distance. Stored vectors are kept as written and
+        # normalized inside the indexed expression, which must match
+        # ix_atoms_embedding_halfvec_ip_hnsw, otherwise the planner falls back
+        # to a sequential scan.
+        halfvec = models.HalfVector(models.EMBEDDING_DIMENSION)
+        query = bindparam(
+            "query_embedding",
+            normalize_embedding(embedding),
+            type_=Vector(models.EMBEDDING_DIMENSION),
+        )
+        normalized = func.l2_normalize(
+            models.Atom.embedding, type_=Vector(models.EMBEDDING_DIMENSION)
+        )
+        return cast(normalized, halfvec).op("<#>", return_type=Float)(
+            cast(query, halfvec)
+        )
+
     def get_embedding_dimension(self, project_id: int) -> int:
         return self._require_project_index(project_id).embedding_dimension
 
     def _require_project_index(self, project_id: int) -> models.ProjectVectorIndex:
+        index = self._indexes.get(project_id)
+        if index is not None:
+            return index
         index = self.session.scalar(
-            select(models.ProjectVectorIndex).where(
-                models.ProjectVectorIndex.project_id == project_id
-            )
+            _SELECT_PROJECT_VECTOR_INDEX, {"project_id": project_id}
         )
         if not index:
             raise KeyError("vector_index_not_found")
+        self._indexes[project_id] = index
         return index
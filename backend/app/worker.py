@@ -1,48 +1,287 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
 import os
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable
 
-from arq import cron
-from arq.connections import RedisSettings
+# Jobs and the default executor share WORKER_THREADS threads, so a worker
+# process never checks out more write connections than that. Size its pool
+# from it (no overflow) instead of the API's 25 + 25 defaults; this has to
+# happen before .db builds the engine. DB_POOL_SIZE / DB_MAX_OVERFLOW set
+# explicitly still win.
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", "16"))
+os.environ.setdefault("DB_POOL_SIZE", str(WORKER_THREADS))
+os.environ.setdefault("DB_MAX_OVERFLOW", "0")
 
-from .db import get_session
-from .services.publisher import PublicationScheduler, PublisherService
-from .services.task_queue import ArqTaskQueue
-from .storage_db import DatabaseStore
+import psycopg  # noqa: E402
+from arq import cron  # noqa: E402
+from arq.worker import run_worker  # noqa: E402
+from sqlalchemy.exc import SQLAlchemyError  # noqa: E402
 
+from .db import engine, get_session  # noqa: E402
+from .observability import get_logger  # noqa: E402
+from .services.publisher import PublicationScheduler, PublisherService  # noqa: E402
+from .services.task_queue import ARQ_QUEUE_NAME, ArqTaskQueue, redis_settings  # noqa: E402
+from .storage_db import DatabaseStore  # noqa: E402
 
-def _publish_sync(publication_id: int, project_id: int) -> str:
+
+def _publish_sync(
+    task_queue: ArqTaskQueue, publication_id: int, project_id: int
+) -> str:
     with get_session() as session:
         store = DatabaseStore(session)
-        service = PublisherService(store, task_queue=ArqTaskQueue())
+        service = PublisherService(store, task_queue=task_queue)
         publication = service.publish_publication(project_id, publication_id)
         return publication.status
 
 
+# Publishing and ticks use the sync store and blocking HTTP clients, so they
+# run on a worker-owned pool rather than the default executor. ORM work holds
+# the GIL, so capacity comes from WORKER_PROCESSES; each process keeps
+# WORKER_THREADS threads (and as many DB connections, plus one for the
+# publication listener) and lets jobs beyond them wait for a thread. The
+# fleet therefore holds up to WORKER_PROCESSES * (WORKER_THREADS + 1)
+# connections; see the README for the budget. The default process count is
+# capped so the default fleet (4 * 17) fits Postgres' max_connections of 100.
+WORKER_PROCESSES = int(
+    os.getenv("WORKER_PROCESSES", str(min(os.cpu_count() or 1, 4)))
+)
+WORKER_MAX_JOBS = int(os.getenv("WORKER_MAX_JOBS", "32"))
+
+
+async def _run_blocking(ctx: dict[str, Any], func: Callable[..., Any], *args: Any) -> Any:
+    # run_in_executor rather than asyncio.to_thread: the job callables read no
+    # context vars, so copying the context and wrapping a partial per job is
+    # pure overhead.
+    return await asyncio.get_running_loop().run_in_executor(ctx["executor"], func, *args)
+
+
 async def publish_content(ctx: dict[str, Any], publication_id: int, project_id: int) -> str:
-    return await asyncio.to_thread(_publish_sync, publication_id, project_id)
+    return await _run_blocking(
+        ctx, _publish_sync, ctx["task_queue"], publication_id, project_id
+    )
+
+
+# With more than one shard the minute's cron tick fans out one job per
+# project_id % PUBLICATION_TICK_SHARDS slice, so ticks run in parallel on
+# whichever worker processes pick them up.
+PUBLICATION_TICK_SHARDS = int(os.getenv("PUBLICATION_TICK_SHARDS", "1"))
+PUBLICATION_TICK_INTERVAL_MINUTES = int(
+    os.getenv("PUBLICATION_TICK_INTERVAL_MINUTES", "1")
+)
 
 
-def _tick_sync() -> int:
+def _tick_sync(task_queue: ArqTaskQueue, shard: int = 0, shards: int = 1) -> int:
     with get_session() as session:
         store = DatabaseStore(session)
-        scheduler = PublicationScheduler(store, ArqTaskQueue())
-        total = 0
-        for project in store.list_projects():
-            total += scheduler.tick(project.id)
-        return total
+        scheduler = PublicationScheduler(store, task_queue)
+        return scheduler.tick_all(
+            limit=int(os.getenv("PUBLICATION_TICK_BATCH_SIZE", "500")),
+            shard=shard,
+            shards=shards,
+        )
+
+
+async def tick_publication_shard(ctx: dict[str, Any], shard: int, shards: int) -> int:
+    return await _run_blocking(ctx, _tick_sync, ctx["task_queue"], shard, shards)
 
 
 async def tick_publication_scheduler(ctx: dict[str, Any]) -> int:
-    return await asyncio.to_thread(_tick_sync)
+    if PUBLICATION_TICK_SHARDS <= 1:
+        return await _run_blocking(ctx, _tick_sync, ctx["task_queue"])
+    # Job ids carry the minute, so a repeated cron run cannot double a slice.
+    minute = datetime.utcnow().strftime("%Y%m%d%H%M")
+    await asyncio.gather(
+        *(
+            ctx["redis"].enqueue_job(
+                "tick_publication_shard",
+                shard=shard,
+                shards=PUBLICATION_TICK_SHARDS,
+                _job_id=f"publication-tick-{minute}-{shard}",
+                _queue_name=ARQ_QUEUE_NAME,
+            )
+            for shard in range(PUBLICATION_TICK_SHARDS)
+        )
+    )
+    return PUBLICATION_TICK_SHARDS
 
 
-class WorkerSettings:
-    redis_settings = RedisSettings.from_dsn(
-        os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Publications written as already due are pushed here by the
+# notify_publication_due trigger, so they are enqueued within milliseconds
+# rather than at the next cron tick; the tick stays as the catch-all. Only
+# the worker holding the advisory lock listens, so each notification is
+# dispatched once across the fleet; the others retry the lock and take over
+# when the leader's connection goes away.
+PUBLICATION_DUE_CHANNEL = "publication_due"
+PUBLICATION_LISTENER_LOCK_ID = 0x7075625F647565  # "pub_due"
+PUBLICATION_LISTEN_RETRY_SECONDS = float(
+    os.getenv("PUBLICATION_LISTEN_RETRY_SECONDS", "5")
+)
+PUBLICATION_NOTIFY_BATCH_SECONDS = float(
+    os.getenv("PUBLICATION_NOTIFY_BATCH_SECONDS", "0.05")
+)
+PUBLICATION_NOTIFY_BATCH_SIZE = int(os.getenv("PUBLICATION_NOTIFY_BATCH_SIZE", "500"))
+
+
+def _dispatch_sync(task_queue: ArqTaskQueue, publication_ids: list[int]) -> int:
+    with get_session() as session:
+        store = DatabaseStore(session)
+        return PublicationScheduler(store, task_queue).dispatch(publication_ids)
+
+
+def _publication_ids(payloads: list[str]) -> list[int]:
+    ids = []
+    for payload in payloads:
+        try:
+            ids.append(int(payload))
+        except ValueError:
+            get_logger().warning(
+                "publication_notify_payload_invalid",
+                extra={"event": "publication_notify_payload_invalid", "payload": payload},
+            )
+    return ids
+
+
+async def _listen_as_leader(ctx: dict[str, Any], conninfo: str) -> None:
+    async with await psycopg.AsyncConnection.connect(
+        conninfo, autocommit=True
+    ) as connection:
+        cursor = await connection.execute(
+            "SELECT pg_try_advisory_lock(%s)", (PUBLICATION_LISTENER_LOCK_ID,)
+        )
+        row = await cursor.fetchone()
+        if not row or not row[0]:
+            return
+        await connection.execute(f"LISTEN {PUBLICATION_DUE_CHANNEL}")
+        while True:
+            # Block for the first notification, then give a burst a short
+            # window to arrive so it is claimed and enqueued as one batch.
+            payloads = [
+                notify.payload async for notify in connection.notifies(stop_after=1)
+            ]
+            payloads += [
+                notify.payload
+                async for notify in connection.notifies(
+                    timeout=PUBLICATION_NOTIFY_BATCH_SECONDS,
+                    stop_after=PUBLICATION_NOTIFY_BATCH_SIZE - 1,
+                )
+            ]
+            publication_ids = _publication_ids(payloads)
+            if publication_ids:
+                await _run_blocking(
+                    ctx, _dispatch_sync, ctx["task_queue"], publication_ids
+                )
+
+
+async def _listen_publication_due(ctx: dict[str, Any]) -> None:
+    conninfo = engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    while True:
+        try:
+            await _listen_as_leader(ctx, conninfo)
+        except Exception as exc:  # noqa: BLE001 - the listener must outlive any error
+            get_logger().warning(
+                "publication_listener_failed",
+                extra={"event": "publication_listener_failed", "error": str(exc)},
+            )
+        await asyncio.sleep(PUBLICATION_LISTEN_RETRY_SECONDS)
+
+
+def _warm_pool() -> None:
+    # Open the connections the job threads will use up front so the first
+    # jobs after a deploy do not each pay a TCP + auth handshake; never more
+    # than there are threads to use them.
+    connections = []
+    try:
+        for _ in range(min(engine.pool.size(), WORKER_THREADS)):
+            connections.append(engine.connect())
+    except SQLAlchemyError as exc:
+        get_logger().warning(
+            "db_pool_warmup_failed",
+            extra={"event": "db_pool_warmup_failed", "error": str(exc)},
+        )
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+async def startup(ctx: dict[str, Any]) -> None:
+    ctx["executor"] = ThreadPoolExecutor(
+        max_workers=WORKER_THREADS, thread_name_prefix="worker-job"
+    )
+    # Bound anything arq or a library pushes to the default executor as well.
+    asyncio.get_running_loop().set_default_executor(ctx["executor"])
+    # Reuse arq's own pool for follow-up enqueues rather than connecting to
+    # Redis from scratch in every job.
+    ctx["task_queue"] = ArqTaskQueue(
+        queue_name=WorkerSettings.queue_name,
+        redis=ctx["redis"],
+        loop=asyncio.get_running_loop(),
     )
-    queue_name = os.getenv("ARQ_QUEUE_NAME", "contentzavod")
-    functions = [publish_content]
-    cron_jobs = [cron(tick_publication_scheduler, minute="*/1")]
+    await _run_blocking(ctx, _warm_pool)
+    ctx["publication_listener"] = asyncio.create_task(_listen_publication_due(ctx))
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    listener = ctx["publication_listener"]
+    listener.cancel()
+    try:
+        await listener
+    except asyncio.CancelledError:
+        pass
+    ctx["executor"].shutdown(wait=True)
+    engine.dispose()
+
+
+class WorkerSettings:
+    redis_settings = redis_settings()
+    queue_name = ARQ_QUEUE_NAME
+    functions = [publish_content, tick_publication_shard]
+    # unique=True takes arq's job-id lock, so one worker in the fleet runs each
+    # tick; the timeout keeps a slow tick from overlapping the next. Due rows
+    # are pushed by LISTEN/NOTIFY, so the tick only has to catch publications
+    # that come due later without a deferred job and missed notifications.
+    cron_jobs = [
+        cron(
+            tick_publication_scheduler,
+            minute=set(range(0, 60, PUBLICATION_TICK_INTERVAL_MINUTES)),
+            unique=True,
+            timeout=50,
+            keep_result=0,
+            max_tries=1,
+        )
+    ]
+    on_startup = startup
+    on_shutdown = shutdown
+    max_jobs = WORKER_MAX_JOBS
+    # arq 0.26 has no Redis Streams delivery; the zset poll interval is the
+    # knob for enqueue-to-run latency versus idle Redis load.
+    poll_delay = float(os.getenv("WORKER_POLL_DELAY_SECONDS", "0.5"))
+
+
+def _run_worker_process() -> None:
+    run_worker(WorkerSettings)
+
+
+def main() -> None:
+    if WORKER_PROCESSES <= 1:
+        _run_worker_process()
+        return
+    # spawn, not fork: every process builds its own engine and Redis pool.
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_run_worker_process, name=f"arq-worker-{index}")
+        for index in range(WORKER_PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Create Date: 2026-01-21
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from pgvector.sqlalchemy import Vector
 
 
@@ -35,9 +36,9 @@ def upgrade() -> None:
         sa.Column("version", sa.Integer(), nullable=False),
         sa.Column("tone", sa.String(length=255), nullable=False),
         sa.Column("audience", sa.String(length=255), nullable=False),
-        sa.Column("offers", sa.JSON(), nullable=False),
-        sa.Column("rubrics", sa.JSON(), nullable=False),
-        sa.Column("forbidden", sa.JSON(), nullable=False),
+        sa.Column("offers", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("rubrics", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("forbidden", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("cta_policy", sa.Text(), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
@@ -102,7 +103,7 @@ def upgrade() -> None:
         sa.Column("channel", sa.String(length=64), nullable=False),
         sa.Column("format", sa.String(length=64), nullable=False),
         sa.Column("body", sa.Text(), nullable=False),
-        sa.Column("metadata", sa.JSON(), nullable=False),
+        sa.Column("metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("status", sa.String(length=32), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
@@ -113,7 +114,7 @@ def upgrade() -> None:
         sa.Column("content_item_id", sa.Integer(), sa.ForeignKey("content_items.id")),
         sa.Column("score", sa.Float(), nullable=False),
         sa.Column("passed", sa.Boolean(), nullable=False),
-        sa.Column("reasons", sa.JSON(), nullable=False),
+        sa.Column("reasons", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
     op.create_table(
@@ -8,6 +8,7 @@ Create Date: 2026-02-10
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -18,13 +19,14 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column("publications", sa.Column("platform_post_url", sa.String(length=512)))
-    op.add_column("publications", sa.Column("idempotency_key", sa.String(length=128)))
-    op.add_column(
-        "publications",
-        sa.Column("attempt_count", sa.Integer(), nullable=False, server_default="0"),
+    # One ALTER TABLE takes the ACCESS EXCLUSIVE lock once for all columns.
+    op.execute(
+        "ALTER TABLE publications "
+        "ADD COLUMN platform_post_url VARCHAR(512), "
+        "ADD COLUMN idempotency_key VARCHAR(128), "
+        "ADD COLUMN attempt_count INTEGER DEFAULT '0' NOT NULL, "
+        "ADD COLUMN last_error TEXT"
     )
-    op.add_column("publications", sa.Column("last_error", sa.Text()))
 
     op.create_table(
         "integration_tokens",
@@ -43,7 +45,7 @@ def upgrade() -> None:
         sa.Column("content_item_id", sa.Integer(), sa.ForeignKey("content_items.id")),
         sa.Column("slug", sa.String(length=64), nullable=False),
         sa.Column("target_url", sa.Text(), nullable=False),
-        sa.Column("utm_params", sa.JSON(), nullable=False),
+        sa.Column("utm_params", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("is_active", sa.Boolean(), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.UniqueConstraint("slug", name="uniq_redirect_slug"),
@@ -57,8 +59,8 @@ def upgrade() -> None:
         sa.Column("ip_address", sa.String(length=64)),
         sa.Column("user_agent", sa.Text()),
         sa.Column("referrer", sa.Text()),
-        sa.Column("utm_params", sa.JSON(), nullable=False),
-        sa.Column("query_params", sa.JSON(), nullable=False),
+        sa.Column("utm_params", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("query_params", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("clicked_at", sa.DateTime(timezone=True), nullable=False),
     )
 
@@ -69,15 +71,15 @@ def upgrade() -> None:
         sa.Column("max_changes_per_week", sa.Integer(), nullable=False),
         sa.Column("rollback_threshold", sa.Float(), nullable=False),
         sa.Column("rollback_window", sa.Integer(), nullable=False),
-        sa.Column("protected_parameters", sa.JSON(), nullable=False),
+        sa.Column("protected_parameters", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
     op.create_table(
         "auto_learning_states",
         sa.Column("id", sa.Integer(), primary_key=True),
         sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), unique=True),
-        sa.Column("parameters", sa.JSON(), nullable=False),
-        sa.Column("stable_parameters", sa.JSON(), nullable=False),
+        sa.Column("parameters", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("stable_parameters", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("window_started_at", sa.DateTime(timezone=True)),
         sa.Column("changes_in_window", sa.Integer(), nullable=False),
         sa.Column("last_change_at", sa.DateTime(timezone=True)),
@@ -94,7 +96,10 @@ def downgrade() -> None:
     op.drop_table("click_events")
     op.drop_table("redirect_links")
     op.drop_table("integration_tokens")
-    op.drop_column("publications", "last_error")
-    op.drop_column("publications", "attempt_count")
-    op.drop_column("publications", "idempotency_key")
-    op.drop_column("publications", "platform_post_url")
+    op.execute(
+        "ALTER TABLE publications "
+        "DROP COLUMN last_error, "
+        "DROP COLUMN attempt_count, "
+        "DROP COLUMN idempotency_key, "
+        "DROP COLUMN platform_post_url"
+    )
@@ -8,6 +8,7 @@ Create Date: 2026-02-20
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -18,13 +19,11 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "brand_configs",
-        sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
-    )
-    op.add_column(
-        "brand_configs",
-        sa.Column("is_stable", sa.Boolean(), nullable=False, server_default="false"),
+    # One ALTER TABLE takes the ACCESS EXCLUSIVE lock once for both columns.
+    op.execute(
+        "ALTER TABLE brand_configs "
+        "ADD COLUMN is_active BOOLEAN DEFAULT 'true' NOT NULL, "
+        "ADD COLUMN is_stable BOOLEAN DEFAULT 'false' NOT NULL"
     )
     op.add_column(
         "prompt_versions",
@@ -38,7 +37,7 @@ def upgrade() -> None:
         sa.Column("brand_config_id", sa.Integer(), sa.ForeignKey("brand_configs.id")),
         sa.Column("version", sa.Integer(), nullable=False),
         sa.Column("change_summary", sa.Text()),
-        sa.Column("change_payload", sa.JSON(), nullable=False),
+        sa.Column("change_payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
     op.create_table(
@@ -49,7 +48,7 @@ def upgrade() -> None:
         sa.Column("prompt_key", sa.String(length=255), nullable=False),
         sa.Column("version", sa.Integer(), nullable=False),
         sa.Column("change_summary", sa.Text()),
-        sa.Column("change_payload", sa.JSON(), nullable=False),
+        sa.Column("change_payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
     op.create_table(
@@ -70,27 +69,28 @@ def upgrade() -> None:
         sa.Column("name", sa.String(length=128), nullable=False),
         sa.Column("provider", sa.String(length=64), nullable=False),
         sa.Column("embedding_dimension", sa.Integer(), nullable=False),
-        sa.Column("metadata", sa.JSON(), nullable=False),
+        sa.Column("metadata", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
         sa.UniqueConstraint("project_id", "name", name="uniq_project_vector_index"),
     )
 
+    # Both back-fills share one scan of projects in a single statement.
     op.execute(
         """
-        INSERT INTO project_datasets
-            (project_id, name, kind, storage_uri, is_active, created_at)
-        SELECT
-            id,
-            'project_' || id || '_dataset',
-            'atoms',
-            's3://datasets/project_' || id,
-            true,
-            NOW()
-        FROM projects
-        """
-    )
-    op.execute(
-        """
+        WITH p AS (SELECT id FROM projects),
+        datasets AS (
+            INSERT INTO project_datasets
+                (project_id, name, kind, storage_uri, is_active, created_at)
+            SELECT
+                id,
+                'project_' || id || '_dataset',
+                'atoms',
+                's3://datasets/project_' || id,
+                true,
+                NOW()
+            FROM p
+            RETURNING 1
+        )
         INSERT INTO project_vector_indexes
             (project_id, name, provider, embedding_dimension, metadata, created_at)
         SELECT
@@ -100,7 +100,7 @@ def upgrade() -> None:
             1536,
             '{"table": "atoms"}',
             NOW()
-        FROM projects
+        FROM p
         """
     )
 
@@ -115,5 +115,6 @@ def downgrade() -> None:
     op.drop_table("prompt_version_history")
     op.drop_table("brand_config_history")
     op.drop_column("prompt_versions", "is_stable")
-    op.drop_column("brand_configs", "is_stable")
-    op.drop_column("brand_configs", "is_active")
+    op.execute(
+        "ALTER TABLE brand_configs DROP COLUMN is_stable, DROP COLUMN is_active"
+    )
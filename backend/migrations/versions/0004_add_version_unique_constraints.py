@@ -0,0 +1,82 @@
+"""add version unique constraints
+
+Revision ID: 0004_add_version_unique_constraints
+Revises: 0003_add_versioning_history_and_project_storage
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_add_version_unique_constraints"
+down_revision = "0003_add_versioning_history_and_project_storage"
+branch_labels = None
+depends_on = None
+
+# The old read-max-then-insert allocation could hand two concurrent writers
+# the same version. Move every duplicate after the first (by id) past the
+# current maximum so no row or its history is lost; history rows keep the
+# version number they were written with.
+_RENUMBER_DUPLICATES = """
+    WITH ranked AS (
+        SELECT
+            id,
+            {partition},
+            ROW_NUMBER() OVER (PARTITION BY {partition}, version ORDER BY id) AS dup
+        FROM {table}
+    ),
+    moved AS (
+        SELECT
+            ranked.id,
+            (
+                SELECT MAX(latest.version) FROM {table} AS latest
+                WHERE {match}
+            ) + ROW_NUMBER() OVER (PARTITION BY {ranked_partition} ORDER BY ranked.id)
+                AS version
+        FROM ranked
+        WHERE ranked.dup > 1
+    )
+    UPDATE {table} SET version = moved.version
+    FROM moved
+    WHERE {table}.id = moved.id
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        _RENUMBER_DUPLICATES.format(
+            table="brand_configs",
+            partition="project_id",
+            ranked_partition="ranked.project_id",
+            match="latest.project_id = ranked.project_id",
+        )
+    )
+    op.execute(
+        _RENUMBER_DUPLICATES.format(
+            table="prompt_versions",
+            partition="project_id, prompt_key",
+            ranked_partition="ranked.project_id, ranked.prompt_key",
+            match=(
+                "latest.project_id = ranked.project_id "
+                "AND latest.prompt_key = ranked.prompt_key"
+            ),
+        )
+    )
+    # The unique indexes behind these constraints also serve the
+    # newest-version lookups (scanned backwards), so no separate
+    # (…, version DESC) index is needed.
+    op.create_unique_constraint(
+        "uniq_brand_config_version", "brand_configs", ["project_id", "version"]
+    )
+    op.create_unique_constraint(
+        "uniq_prompt_version",
+        "prompt_versions",
+        ["project_id", "prompt_key", "version"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uniq_prompt_version", "prompt_versions", type_="unique")
+    op.drop_constraint("uniq_brand_config_version", "brand_configs", type_="unique")
@@ -0,0 +1,29 @@
+"""add budget usage date index
+
+Revision ID: 0005_add_budget_usage_date_index
+Revises: 0004_add_version_unique_constraints
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_add_budget_usage_date_index"
+down_revision = "0004_add_version_unique_constraints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_budget_usages_project_date",
+        "budget_usages",
+        ["project_id", "usage_date"],
+        postgresql_include=["token_used", "video_seconds_used", "publications_used"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_budget_usages_project_date", table_name="budget_usages")
@@ -0,0 +1,38 @@
+"""add due publications index
+
+Revision ID: 0006_add_due_publications_index
+Revises: 0005_add_budget_usage_date_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_add_due_publications_index"
+down_revision = "0005_add_budget_usage_date_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently so the scheduler keeps writing publications meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_publications_due",
+            "publications",
+            ["project_id", "scheduled_at"],
+            postgresql_where=sa.text("status = 'scheduled'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_publications_due",
+            table_name="publications",
+            postgresql_concurrently=True,
+        )
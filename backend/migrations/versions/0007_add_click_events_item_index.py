@@ -0,0 +1,28 @@
+"""add click events item index
+
+Revision ID: 0007_add_click_events_item_index
+Revises: 0006_add_due_publications_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_add_click_events_item_index"
+down_revision = "0006_add_due_publications_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_click_events_project_item",
+        "click_events",
+        ["project_id", "content_item_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_click_events_project_item", table_name="click_events")
@@ -0,0 +1,30 @@
+"""add active prompt versions index
+
+Revision ID: 0008_add_active_prompt_versions_index
+Revises: 0007_add_click_events_item_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_add_active_prompt_versions_index"
+down_revision = "0007_add_click_events_item_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_prompt_versions_active",
+        "prompt_versions",
+        ["project_id", "prompt_key"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_prompt_versions_active", table_name="prompt_versions")
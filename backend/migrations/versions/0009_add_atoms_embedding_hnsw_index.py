@@ -0,0 +1,36 @@
+"""add atoms embedding hnsw index
+
+Revision ID: 0009_add_atoms_embedding_hnsw_index
+Revises: 0008_add_active_prompt_versions_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0009_add_atoms_embedding_hnsw_index"
+down_revision = "0008_add_active_prompt_versions_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The final ANN index in one build: normalized inside the expression (the
+    # stored vectors stay as written) and cast to halfvec, which needs
+    # pgvector >= 0.7. HNSW builds are slow on large tables; build without
+    # blocking ingest.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_atoms_embedding_halfvec_ip_hnsw "
+            "ON atoms USING hnsw "
+            "((l2_normalize(embedding)::halfvec(1536)) halfvec_ip_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_atoms_embedding_halfvec_ip_hnsw"
+        )
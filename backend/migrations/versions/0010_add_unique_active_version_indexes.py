@@ -0,0 +1,74 @@
+"""add unique active version indexes
+
+Revision ID: 0010_add_unique_active_version_indexes
+Revises: 0009_add_atoms_embedding_hnsw_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_add_unique_active_version_indexes"
+down_revision = "0009_add_atoms_embedding_hnsw_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep only the newest active row per key before enforcing uniqueness.
+    op.execute(
+        """
+        UPDATE prompt_versions AS pv
+        SET is_active = false
+        WHERE pv.is_active
+          AND EXISTS (
+              SELECT 1 FROM prompt_versions AS newer
+              WHERE newer.project_id = pv.project_id
+                AND newer.prompt_key = pv.prompt_key
+                AND newer.is_active
+                AND newer.version > pv.version
+          )
+        """
+    )
+    op.execute(
+        """
+        UPDATE brand_configs AS bc
+        SET is_active = false
+        WHERE bc.is_active
+          AND EXISTS (
+              SELECT 1 FROM brand_configs AS newer
+              WHERE newer.project_id = bc.project_id
+                AND newer.is_active
+                AND newer.version > bc.version
+          )
+        """
+    )
+    op.drop_index("ix_prompt_versions_active", table_name="prompt_versions")
+    op.create_index(
+        "uq_prompt_versions_active",
+        "prompt_versions",
+        ["project_id", "prompt_key"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+    )
+    op.create_index(
+        "uq_brand_configs_active",
+        "brand_configs",
+        ["project_id"],
+        unique=True,
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_brand_configs_active", table_name="brand_configs")
+    op.drop_index("uq_prompt_versions_active", table_name="prompt_versions")
+    op.create_index(
+        "ix_prompt_versions_active",
+        "prompt_versions",
+        ["project_id", "prompt_key"],
+        postgresql_where=sa.text("is_active"),
+    )
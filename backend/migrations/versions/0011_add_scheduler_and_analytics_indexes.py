@@ -0,0 +1,55 @@
+"""add scheduler and analytics indexes
+
+Revision ID: 0011_add_scheduler_and_analytics_indexes
+Revises: 0010_add_unique_active_version_indexes
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_add_scheduler_and_analytics_indexes"
+down_revision = "0010_add_unique_active_version_indexes"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    # Cross-project scheduler tick: ORDER BY scheduled_at over due rows only.
+    (
+        "ix_publications_scheduled_at_due",
+        "publications",
+        ["scheduled_at"],
+        {"postgresql_where": sa.text("status = 'scheduled'")},
+    ),
+    ("ix_click_events_link_time", "click_events", ["redirect_link_id", "clicked_at"], {}),
+    (
+        "ix_metrics_snapshots_project_time",
+        "metrics_snapshots",
+        ["project_id", "collected_at"],
+        {},
+    ),
+    (
+        "ix_metrics_snapshots_item_time",
+        "metrics_snapshots",
+        ["content_item_id", "collected_at"],
+        {},
+    ),
+)
+
+
+def upgrade() -> None:
+    # Built concurrently so publishing and click tracking keep writing.
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in _INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, **options
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
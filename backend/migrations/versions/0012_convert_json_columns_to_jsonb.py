@@ -0,0 +1,77 @@
+"""convert json columns to jsonb
+
+Revision ID: 0012_convert_json_columns_to_jsonb
+Revises: 0011_add_scheduler_and_analytics_indexes
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_convert_json_columns_to_jsonb"
+down_revision = "0011_add_scheduler_and_analytics_indexes"
+branch_labels = None
+depends_on = None
+
+_JSON_COLUMNS = {
+    "brand_configs": ("offers", "rubrics", "forbidden"),
+    "content_items": ("metadata",),
+    "qc_reports": ("reasons",),
+    "redirect_links": ("utm_params",),
+    "click_events": ("utm_params", "query_params"),
+    "auto_learning_configs": ("protected_parameters",),
+    "auto_learning_states": ("parameters", "stable_parameters"),
+    "brand_config_history": ("change_payload",),
+    "prompt_version_history": ("change_payload",),
+    "project_vector_indexes": ("metadata",),
+}
+
+
+def _convert(source_type: str, target_type: str) -> None:
+    bind = op.get_bind()
+    for table, columns in _JSON_COLUMNS.items():
+        # Databases created after 0001-0003 switched to JSONB already have the
+        # target type; skip them so the table is not rewritten for nothing.
+        pending = bind.execute(
+            sa.text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = :table "
+                "AND data_type = :data_type"
+            ),
+            {"table": table, "data_type": source_type},
+        ).scalars().all()
+        clauses = [
+            f'ALTER COLUMN "{column}" TYPE {target_type} '
+            f'USING "{column}"::{target_type}'
+            for column in columns
+            if column in pending
+        ]
+        if clauses:
+            # One ALTER TABLE rewrites the table once for all of its columns.
+            op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def upgrade() -> None:
+    _convert("json", "jsonb")
+    # Built concurrently so click tracking keeps writing.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_click_events_utm_params_gin",
+            "click_events",
+            ["utm_params"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_click_events_utm_params_gin",
+            table_name="click_events",
+            postgresql_concurrently=True,
+        )
+    _convert("jsonb", "json")
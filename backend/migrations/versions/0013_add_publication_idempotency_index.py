@@ -0,0 +1,58 @@
+"""add publication idempotency index
+
+Revision ID: 0013_add_publication_idempotency_index
+Revises: 0012_convert_json_columns_to_jsonb
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_add_publication_idempotency_index"
+down_revision = "0012_convert_json_columns_to_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicate keys are left for an operator to resolve rather than rewritten
+    # here: which row is the real publication cannot be decided safely.
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT project_id, idempotency_key, COUNT(*) AS copies "
+            "FROM publications WHERE idempotency_key IS NOT NULL "
+            "GROUP BY project_id, idempotency_key HAVING COUNT(*) > 1 "
+            "ORDER BY project_id, idempotency_key LIMIT 20"
+        )
+    ).all()
+    if duplicates:
+        listed = ", ".join(
+            f"project {row.project_id} key {row.idempotency_key!r} x{row.copies}"
+            for row in duplicates
+        )
+        raise RuntimeError(
+            "publications has duplicate (project_id, idempotency_key) pairs; "
+            f"resolve them before upgrading: {listed}"
+        )
+    # Built concurrently so the scheduler keeps writing publications meanwhile.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_publications_idempotency_key",
+            "publications",
+            ["project_id", "idempotency_key"],
+            unique=True,
+            postgresql_where=sa.text("idempotency_key IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_publications_idempotency_key",
+            table_name="publications",
+            postgresql_concurrently=True,
+        )
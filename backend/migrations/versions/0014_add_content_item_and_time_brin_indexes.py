@@ -0,0 +1,52 @@
+"""add content item and time brin indexes
+
+Revision ID: 0014_add_content_item_and_time_brin_indexes
+Revises: 0013_add_publication_idempotency_index
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_add_content_item_and_time_brin_indexes"
+down_revision = "0013_add_publication_idempotency_index"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    # Postgres does not index foreign keys on its own; project listings and
+    # content pack deletes otherwise scan content_items.
+    ("ix_content_items_project", "content_items", ["project_id"], {}),
+    ("ix_content_items_pack", "content_items", ["pack_id"], {}),
+    # Append-only time series: BRIN keeps time-window scans cheap without the
+    # footprint of another btree on the hottest write paths.
+    (
+        "ix_metrics_snapshots_collected_at_brin",
+        "metrics_snapshots",
+        ["collected_at"],
+        {"postgresql_using": "brin"},
+    ),
+    (
+        "ix_click_events_clicked_at_brin",
+        "click_events",
+        ["clicked_at"],
+        {"postgresql_using": "brin"},
+    ),
+)
+
+
+def upgrade() -> None:
+    # Built concurrently so content generation and click tracking keep writing.
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in _INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, **options
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,63 @@
+"""add publication due notify trigger
+
+Revision ID: 0015_add_publication_due_notify_trigger
+Revises: 0014_add_content_item_and_time_brin_indexes
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0015_add_publication_due_notify_trigger"
+down_revision = "0014_add_content_item_and_time_brin_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NOTIFY is delivered on commit, so the worker's listener only ever sees
+    # rows it can read.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_publication_due() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('publication_due', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER publications_notify_due_insert
+        AFTER INSERT ON publications
+        FOR EACH ROW
+        WHEN (NEW.status = 'scheduled' AND NEW.scheduled_at <= now())
+        EXECUTE FUNCTION notify_publication_due()
+        """
+    )
+    # Only a real reschedule into the past notifies; status flips (e.g. a
+    # failed publish going back to retry) leave scheduled_at to the backoff.
+    op.execute(
+        """
+        CREATE TRIGGER publications_notify_due_reschedule
+        AFTER UPDATE OF scheduled_at ON publications
+        FOR EACH ROW
+        WHEN (
+            NEW.status = 'scheduled'
+            AND NEW.scheduled_at <= now()
+            AND OLD.scheduled_at IS DISTINCT FROM NEW.scheduled_at
+        )
+        EXECUTE FUNCTION notify_publication_due()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS publications_notify_due_reschedule ON publications"
+    )
+    op.execute("DROP TRIGGER IF EXISTS publications_notify_due_insert ON publications")
+    op.execute("DROP FUNCTION IF EXISTS notify_publication_due()")
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from backend.app import models, schemas  # noqa: E402
+from backend.app.services.publisher import PublicationScheduler  # noqa: E402
+
+
+class RecordingQueue:
+    def __init__(self) -> None:
+        self.jobs: list[tuple[str, dict, Optional[datetime], Optional[str]]] = []
+
+    def enqueue(
+        self,
+        task_name: str,
+        payload: dict,
+        run_at: Optional[datetime] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        self.jobs.append((task_name, payload, run_at, idempotency_key))
+        return idempotency_key or ""
+
+    def enqueue_many(
+        self,
+        tasks: Sequence[tuple[str, dict, Optional[datetime], Optional[str]]],
+    ) -> list[str]:
+        self.jobs.extend(tasks)
+        return [idempotency_key or "" for *_, idempotency_key in tasks]
+
+    @property
+    def job_ids(self) -> list[Optional[str]]:
+        return [idempotency_key for *_, idempotency_key in self.jobs]
+
+
+@pytest.fixture
+def content_item(store, project):
+    topic = store.create_topic(
+        project.id, schemas.TopicCreate(title="topic", angle="angle")
+    )
+    pack = store.create_content_pack(
+        project.id, schemas.ContentPackCreate(topic_id=topic.id)
+    )
+    return store.create_content_item(
+        project.id,
+        schemas.ContentItemCreate(
+            pack_id=pack.id, channel="telegram", format="post", body="text"
+        ),
+    )
+
+
+def _publication(store, project, content_item, scheduled_at, **overrides):
+    return store.create_publication(
+        project.id,
+        schemas.PublicationCreate(
+            content_item_id=content_item.id,
+            platform="telegram",
+            scheduled_at=scheduled_at,
+            **overrides,
+        ),
+    )
+
+
+def _status(store, publication_id: int) -> str:
+    return store.session.get(models.Publication, publication_id).status
+
+
+def test_tick_all_claims_due_rows_once(store, project, content_item):
+    now = datetime.utcnow()
+    due = _publication(store, project, content_item, now - timedelta(minutes=5))
+    future = _publication(store, project, content_item, now + timedelta(hours=1))
+    failed = _publication(
+        store, project, content_item, now - timedelta(minutes=5), status="failed"
+    )
+    queue = RecordingQueue()
+    scheduler = PublicationScheduler(store, queue)
+
+    assert scheduler.tick_all(now=now) == 1
+    assert queue.job_ids == [f"publication-{due.id}"]
+    assert _status(store, due.id) == "queued"
+    assert _status(store, future.id) == "scheduled"
+    assert _status(store, failed.id) == "failed"
+
+    # Claimed rows left "scheduled", so the next tick has nothing to redo.
+    assert scheduler.tick_all(now=now) == 0
+    assert len(queue.jobs) == 1
+
+
+def test_tick_all_takes_oldest_first_and_moves_on(store, project, content_item):
+    now = datetime.utcnow()
+    publications = [
+        _publication(store, project, content_item, now - timedelta(minutes=minutes))
+        for minutes in (1, 3, 2)
+    ]
+    queue = RecordingQueue()
+    scheduler = PublicationScheduler(store, queue)
+
+    assert scheduler.tick_all(now=now, limit=2) == 2
+    assert scheduler.tick_all(now=now, limit=2) == 1
+    # UPDATE ... RETURNING does not keep the subquery order, so compare sets.
+    assert set(queue.job_ids[:2]) == {
+        f"publication-{publications[1].id}",
+        f"publication-{publications[2].id}",
+    }
+    assert queue.job_ids[2:] == [f"publication-{publications[0].id}"]
+
+
+def test_tick_all_respects_shards(store, project, content_item):
+    now = datetime.utcnow()
+    _publication(store, project, content_item, now - timedelta(minutes=1))
+    scheduler = PublicationScheduler(store, RecordingQueue())
+    other_shard = (project.id + 1) % 2
+
+    assert scheduler.tick_all(now=now, shard=other_shard, shards=2) == 0
+    assert scheduler.tick_all(now=now, shard=project.id % 2, shards=2) == 1
+
+
+def test_dispatch_enqueues_only_listed_due_rows(store, project, content_item):
+    now = datetime.utcnow()
+    due = _publication(store, project, content_item, now - timedelta(seconds=1))
+    other_due = _publication(store, project, content_item, now - timedelta(seconds=1))
+    future = _publication(store, project, content_item, now + timedelta(hours=1))
+    queue = RecordingQueue()
+    scheduler = PublicationScheduler(store, queue)
+
+    assert scheduler.dispatch([due.id, future.id, 0], now=now) == 1
+    assert queue.job_ids == [f"publication-{due.id}"]
+    assert _status(store, other_due.id) == "scheduled"
+    assert _status(store, future.id) == "scheduled"
+
+    # A repeated notification for an already queued row is a no-op.
+    assert scheduler.dispatch([due.id], now=now) == 0
+
+
+def test_create_publication_returns_existing_row_for_same_key(
+    store, project, content_item
+):
+    scheduled_at = datetime.utcnow()
+    first = _publication(
+        store, project, content_item, scheduled_at, idempotency_key="same"
+    )
+    second = _publication(
+        store, project, content_item, scheduled_at, idempotency_key="same"
+    )
+
+    assert second.id == first.id
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from backend.app import models, schemas  # noqa: E402
+from backend.app.storage_db import DatabaseStore  # noqa: E402
+
+WRITERS = 8
+
+
+def _brand_config(tone: str) -> schemas.BrandConfigCreate:
+    return schemas.BrandConfigCreate(tone=tone, audience="all", cta_policy="soft")
+
+
+def test_brand_config_versions_increment_and_keep_one_active(store, project):
+    versions = [
+        store.create_brand_config(project.id, _brand_config(f"tone {index}")).version
+        for index in range(3)
+    ]
+
+    assert versions == [1, 2, 3]
+    configs = store.list_brand_configs(project.id)
+    assert [config.version for config in configs if config.is_active] == [3]
+    history = store.session.query(models.BrandConfigHistory).filter_by(
+        project_id=project.id
+    )
+    assert sorted(entry.version for entry in history) == [1, 2, 3]
+
+
+def test_concurrent_active_prompt_versions_all_succeed(session_factory, project):
+    def create(index: int) -> int:
+        with session_factory() as session:
+            prompt = DatabaseStore(session).create_prompt_version(
+                project.id,
+                schemas.PromptVersionCreate(
+                    prompt_key="post", content=f"draft {index}", is_active=True
+                ),
+            )
+            session.commit()
+            return prompt.version
+
+    with ThreadPoolExecutor(max_workers=WRITERS) as executor:
+        versions = list(executor.map(create, range(WRITERS)))
+
+    assert sorted(versions) == list(range(1, WRITERS + 1))
+    with session_factory() as session:
+        prompts = DatabaseStore(session).list_prompt_versions(project.id)
+    assert [prompt.version for prompt in prompts if prompt.is_active] == [WRITERS]
+
+
+def test_concurrent_brand_configs_all_succeed(session_factory, project):
+    def create(index: int) -> int:
+        with session_factory() as session:
+            config = DatabaseStore(session).create_brand_config(
+                project.id, _brand_config(f"tone {index}")
+            )
+            session.commit()
+            return config.version
+
+    with ThreadPoolExecutor(max_workers=WRITERS) as executor:
+        versions = list(executor.map(create, range(WRITERS)))
+
+    assert sorted(versions) == list(range(1, WRITERS + 1))
+    with session_factory() as session:
+        configs = DatabaseStore(session).list_brand_configs(project.id)
+    assert [config.version for config in configs if config.is_active] == [WRITERS]